@@ -0,0 +1,60 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#    "python-dotenv",
+#    "typer",
+#    "urlscan-python",
+# ]
+# ///
+
+# this script demonstrates how to scan URLs concurrently & get their results.
+# usage: uv run examples/bulk_scan.py <URL>...
+#        (e.g. uv run examples/bulk_scan.py https://example.com https://example.org)
+
+import os
+from typing import Annotated, cast
+
+import typer
+from dotenv import load_dotenv
+
+import urlscan
+from urlscan.types import VisibilityType
+
+load_dotenv()
+
+API_KEY = os.getenv("URLSCAN_API_KEY")
+
+
+def main(
+    url: Annotated[list[str], typer.Argument(help="URLs to scan")],
+    api_key: Annotated[
+        str | None,
+        typer.Option(help="Your API key. Defaults to URLSCAN_API_KEY env."),
+    ] = None,
+    visibility: Annotated[
+        str, typer.Option(help="Visibility of scans (public, private or unlisted)")
+    ] = "public",
+    concurrency: Annotated[
+        int, typer.Option(help="Maximum number of concurrent requests")
+    ] = 4,
+) -> None:
+    api_key = api_key or API_KEY
+    assert api_key, "API key is required"
+
+    visibility_ = cast(VisibilityType, visibility)
+
+    with urlscan.Client(api_key) as client:
+        results = client.bulk_scan_and_get_results(
+            url, visibility=visibility_, max_workers=concurrency
+        )
+
+    for u, result in results:
+        if isinstance(result, Exception):
+            print(f"Failed to scan {u}: {result}")  # noqa: T201
+            continue
+
+        print(result["task"]["reportURL"])  # noqa: T201
+
+
+if __name__ == "__main__":
+    typer.run(main)
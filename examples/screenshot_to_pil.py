@@ -12,6 +12,9 @@
 # usage: uv run examples/screenshot_to_pil.py <UUID>
 
 import os
+import tempfile
+import webbrowser
+from pathlib import Path
 from typing import Annotated
 
 import typer
@@ -37,8 +40,17 @@ def main(
 
     with urlscan.Client(api_key) as client:
         screenshot = client.get_screenshot(uuid)
-        image = Image.open(screenshot)
-        image.show()
+
+    # screenshots are always PNG, so skip probing the other image plugins
+    image = Image.open(screenshot, formats=["PNG"])
+    print(f"format={image.format}, size={image.size}, mode={image.mode}")  # noqa: T201
+
+    # Image.show() re-encodes the decoded image to a temporary file,
+    # so show the original PNG bytes instead
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+        f.write(screenshot.getvalue())
+
+    webbrowser.open(Path(f.name).as_uri())
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 # dependencies = [
 #    "python-dotenv",
 #    "typer",
-#    "urlscan-python",
+#    "urlscan-python[http2]",
 # ]
 # ///
 
@@ -12,6 +12,7 @@
 #        (e.g. uv run examples/search_and_download_screenshots.py domain:example.com)
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Annotated
 
@@ -25,6 +26,15 @@ load_dotenv()
 API_KEY = os.getenv("URLSCAN_API_KEY")
 
 
+def download_screenshot(client: urlscan.Client, uuid: str, dest: Path) -> Path:
+    path = dest / f"{uuid}.png"
+    # stream the screenshot into the file chunk by chunk (instead of buffering it in memory)
+    with path.open("wb") as f:
+        client.download_screenshot(uuid, file=f)
+
+    return path
+
+
 def main(
     query: Annotated[str, typer.Argument(help="Search query")],
     api_key: Annotated[
@@ -35,18 +45,27 @@ def main(
     dest: Annotated[
         Path, typer.Option(help="Destination directory to download screenshots")
     ] = Path("/tmp"),
+    concurrency: Annotated[
+        int, typer.Option(help="Maximum number of concurrent downloads")
+    ] = 8,
+    http2: Annotated[
+        bool, typer.Option(help="Multiplex downloads over a single HTTP/2 connection")
+    ] = True,
 ) -> None:
     api_key = api_key or API_KEY
     assert api_key, "API key is required"
 
-    with urlscan.Client(api_key) as client:
-        for result in client.search(query, limit=limit):
-            _id: str = result["_id"]
-            screenshot = client.get_screenshot(_id)
-
-            path = dest / f"{_id}.png"
-            path.write_bytes(screenshot.read())
-            print(f"Downloaded screenshot to {path}")  # noqa: T201
+    # the client (connection pool) is thread-safe, so it can be shared by the workers
+    with (
+        urlscan.Client(api_key, http2=http2) as client,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+    ):
+        futures = [
+            executor.submit(download_screenshot, client, result["_id"], dest)
+            for result in client.search(query, limit=limit)
+        ]
+        for future in as_completed(futures):
+            print(f"Downloaded screenshot to {future.result()}")  # noqa: T201
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 # dependencies = [
 #    "itables",
 #    "pandas",
+#    "pyarrow",
 #    "python-dotenv",
 #    "typer",
 #    "urlscan-python",
@@ -13,13 +14,18 @@
 # usage: uv run examples/search_to_dataframe.py <QUERY>
 #        (e.g. uv run examples/search_to_dataframe.py domain:example.com)
 
+import hashlib
+import json
 import os
+import time
 import webbrowser
 from pathlib import Path
 from typing import Annotated
 
 import itables
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json
 import typer
 from dotenv import load_dotenv
 
@@ -29,6 +35,79 @@ load_dotenv()
 
 API_KEY = os.getenv("URLSCAN_API_KEY")
 
+CACHE_DIR = Path.home() / ".cache" / "urlscan-python"
+
+# commonly used fields of search results
+# (parsing with a fixed schema skips schema inference & unused fields)
+SCHEMA = pa.schema(
+    [
+        ("_id", pa.string()),
+        (
+            "task",
+            pa.struct(
+                [
+                    ("time", pa.string()),
+                    ("url", pa.string()),
+                    ("visibility", pa.string()),
+                ]
+            ),
+        ),
+        (
+            "page",
+            pa.struct(
+                [
+                    ("url", pa.string()),
+                    ("domain", pa.string()),
+                    ("ip", pa.string()),
+                    ("country", pa.string()),
+                    ("status", pa.string()),
+                    ("title", pa.string()),
+                ]
+            ),
+        ),
+    ]
+)
+
+
+def get_cache_path(api_key: str, query: str, limit: int) -> Path:
+    # include the API key since search results depend on its permissions
+    key = hashlib.sha256(f"{api_key}|{query}|{limit}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.jsonl"
+
+
+def is_fresh(path: Path, ttl: int) -> bool:
+    return path.exists() and time.time() - path.stat().st_mtime < ttl
+
+
+def save_results(client: urlscan.Client, query: str, limit: int, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w") as f:
+        for result in client.search(query, limit=limit):
+            f.write(json.dumps(result) + "\n")
+
+    tmp.replace(path)
+
+
+def read_results(path: Path, all_fields: bool = False) -> pd.DataFrame:
+    if path.stat().st_size == 0:
+        return pd.DataFrame()
+
+    parse_options = (
+        None
+        if all_fields
+        else pyarrow.json.ParseOptions(
+            explicit_schema=SCHEMA, unexpected_field_behavior="ignore"
+        )
+    )
+    # parse JSON lines in C & keep columns Arrow-backed
+    table = pyarrow.json.read_json(path, parse_options=parse_options)
+    # flatten nested objects into dotted columns (e.g. "page.domain") like pd.json_normalize
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
 
 def main(
     query: Annotated[str, typer.Argument(help="Search query")],
@@ -40,14 +119,24 @@ def main(
     path: Annotated[
         Path, typer.Option(help="Path to save a dataframe as an HTML file")
     ] = Path("report.html"),
+    cache_ttl: Annotated[
+        int, typer.Option(help="Seconds to reuse cached search results (0 to disable)")
+    ] = 3600,
+    all_fields: Annotated[
+        bool, typer.Option(help="Include all the fields instead of the common ones")
+    ] = False,
 ) -> None:
     api_key = api_key or API_KEY
     assert api_key
 
-    with urlscan.Client(api_key) as client:
-        results = list(client.search(query, limit=limit))
+    # search results are cached as JSON lines to avoid re-running the same query
+    cache_path = get_cache_path(api_key, query, limit)
+    if not is_fresh(cache_path, cache_ttl):
+        with urlscan.Client(api_key) as client:
+            save_results(client, query, limit, cache_path)
+
+    df = read_results(cache_path, all_fields=all_fields)
 
-    df = pd.json_normalize(results)
     html = itables.to_html_datatable(df)
     path.write_text(html)
 
@@ -1,5 +1,8 @@
 """The official Python API client for urlscan.io."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 try:
     from ._version import version
 
@@ -7,8 +10,47 @@ try:
 except ImportError:
     __version__ = "0.0.0"
 
-from .client import Client  # noqa: F401
-from .error import APIError, RateLimitError  # noqa: F401
-from .iterator import SearchIterator  # noqa: F401
-from .pro import Pro  # noqa: F401
-from .types import LiveScanResourceType, VisibilityType  # noqa: F401
+from .error import APIError, RateLimitError
+from .types import LiveScanResourceType, VisibilityType
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .client import Client
+    from .iterator import SearchIterator
+    from .pro import Pro
+
+__all__ = [
+    "APIError",
+    "AsyncClient",
+    "Client",
+    "LiveScanResourceType",
+    "Pro",
+    "RateLimitError",
+    "SearchIterator",
+    "VisibilityType",
+    "__version__",
+]
+
+# modules depending on httpx are imported on first access (PEP 562)
+# to keep `import urlscan` cheap
+_LAZY_IMPORTS = {
+    "AsyncClient": ".async_client",
+    "Client": ".client",
+    "SearchIterator": ".iterator",
+    "Pro": ".pro",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # cache it in the module namespace so __getattr__ is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,8 @@
+"""Optional dependencies for urlscan.io API client."""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+__all__ = ["orjson"]
@@ -0,0 +1 @@
+version = "0.0.0.post1.dev0+418abe7"
@@ -0,0 +1,523 @@
+"""Async client module for urlscan.io API."""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from typing import Any, BinaryIO
+
+import httpx
+from httpx._types import QueryParamTypes, RequestData, TimeoutTypes
+
+from .client import (
+    BASE_URL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIMITS,
+    USER_AGENT,
+    ClientResponse,
+    RateLimitMemo,
+    _build_request,
+    _ClientMixin,
+    logger,
+)
+from .iterator import AsyncSearchIterator
+from .types import ActionType, SearchDataSource, VisibilityType
+from .utils import _backoff
+
+
+class AsyncClient(_ClientMixin):
+    """Async client for urlscan.io API.
+
+    Independent requests can be sent concurrently with asyncio.gather.
+
+    Examples:
+        >>> import asyncio
+        >>> from urlscan import AsyncClient
+        >>> async def main(uuids: list[str]) -> list[dict]:
+        ...     async with AsyncClient("<your_api_key>") as client:
+        ...         return await asyncio.gather(*(client.get_result(uuid) for uuid in uuids))
+
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        user_agent: str = USER_AGENT,
+        trust_env: bool = False,
+        timeout: TimeoutTypes = 60,
+        proxy: str | None = None,
+        verify: bool = True,
+        follow_redirects: bool = True,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        """Initialize the async client.
+
+        Args:
+            api_key (str): Your urlscan.io API key.
+            base_url (str, optional): Base URL. Defaults to BASE_URL.
+            user_agent (str, optional): User agent. Defaults to USER_AGENT.
+            trust_env (bool, optional): Enable or disable usage of environment variables for configuration. Defaults to False.
+            timeout (TimeoutTypes, optional): timeout configuration to use when sending request. Defaults to 60.
+            proxy (str | None, optional): Proxy URL where all the traffic should be routed. Defaults to None.
+            verify (bool, optional): Either `True` to use an SSL context with the default CA bundle, `False` to disable verification. Defaults to True.
+            follow_redirects (bool, optional): Whether to follow redirects. Defaults to True.
+            limits (httpx.Limits | None, optional): Connection pool limits. Set larger limits when sending many requests concurrently. Defaults to None (DEFAULT_LIMITS).
+            http2 (bool, optional): Whether to enable HTTP/2 to multiplex concurrent requests over a single connection. Requires the `http2` extra. Defaults to False.
+
+        """
+        self._api_key = api_key
+        self._base_url = base_url
+        self._user_agent = user_agent
+
+        self._session = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "User-Agent": user_agent,
+                "API-Key": api_key,
+            },
+            timeout=timeout,
+            proxy=proxy,
+            verify=verify,
+            trust_env=trust_env,
+            follow_redirects=follow_redirects,
+            limits=limits or DEFAULT_LIMITS,
+            http2=http2,
+        )
+        self._rate_limit_memo: RateLimitMemo = {
+            "public": None,
+            "private": None,
+            "unlisted": None,
+            "retrieve": None,
+            "search": None,
+        }
+
+        # scan UUID -> timestamp, ordered by insertion (oldest first)
+        self._scan_uuid_timestamp_memo: OrderedDict[str, float] = OrderedDict()
+        self._scan_uuid_timestamp_memo_lock = threading.Lock()
+
+    async def __aenter__(self):
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, item_type: Any, value: Any, traceback: Any):
+        """Exit the async context manager and close the session."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the session."""
+        await self._session.aclose()
+
+    async def _send_request(
+        self, request: httpx.Request, *, stream: bool = False
+    ) -> ClientResponse:
+        self._check_rate_limit(request)
+        res = ClientResponse(await self._session.send(request, stream=stream))
+        self._memoize_rate_limit(res)
+        return res
+
+    async def _get(
+        self, path: str, params: QueryParamTypes | None = None
+    ) -> ClientResponse:
+        """Send a GET request to a given API endpoint.
+
+        Args:
+            path (str): Path to API endpoint.
+            params (QueryParamTypes | None, optional): Query parameters. Defaults to None.
+
+        Returns:
+            ClientResponse: Response.
+
+        """
+        req = self._session.build_request("GET", path, params=params)
+        return await self._send_request(req)
+
+    async def _post(
+        self,
+        path: str,
+        json: Any | None = None,
+        data: RequestData | None = None,
+        action: ActionType | None = None,
+    ) -> ClientResponse:
+        """Send a POST request to a given API endpoint.
+
+        Args:
+            path (str): Path.
+            json (Any | None, optional): Dict to send in request body as JSON. Defaults to None.
+            data (RequestData | None, optional): Dict to send in request body. Defaults to None.
+            action (ActionType | None, optional): Rate limit action of the request. It saves re-parsing the request body to find it. Defaults to None.
+
+        Returns:
+            ClientResponse: Response.
+
+        """
+        req = _build_request(self._session, "POST", path, json=json, data=data)
+        if action:
+            req.extensions["urlscan_action"] = action
+
+        return await self._send_request(req)
+
+    async def get_json(self, path: str, params: QueryParamTypes | None = None) -> dict:
+        """Send a GET request and return the JSON response."""
+        res = await self._get(path, params=params)
+        return self._response_to_json(res)
+
+    async def get_content(
+        self, path: str, params: QueryParamTypes | None = None
+    ) -> bytes:
+        """Send a GET request and return the response content as bytes."""
+        res = await self._get(path, params=params)
+        return self._response_to_content(res)
+
+    async def get_text(self, path: str, params: QueryParamTypes | None = None) -> str:
+        """Send a GET request and return the response content as text."""
+        res = await self._get(path, params=params)
+        return self._response_to_str(res)
+
+    async def download(
+        self,
+        path: str,
+        file: BinaryIO | str | os.PathLike,
+        params: QueryParamTypes | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Download a file from a given API endpoint.
+
+        The response body is streamed and written to the file chunk by chunk,
+        so the whole file is never held in memory. The file is opened, written and closed
+        in a thread (asyncio.to_thread) so that the event loop is not blocked.
+
+        Args:
+            path (str): Path to API endpoint.
+            file (BinaryIO | str | os.PathLike): File object or file path to write to. A file path is opened (and truncated) only after a successful response.
+            params (QueryParamTypes | None, optional): Query parameters. Defaults to None.
+            chunk_size (int, optional): Size of chunks in bytes to write. Defaults to DEFAULT_CHUNK_SIZE (64 KiB).
+
+        """
+        req = self._session.build_request("GET", path, params=params)
+        res = await self._send_request(req, stream=True)
+        try:
+            if not 200 <= res.status_code < 300:
+                # read the error (or redirect) response to build an error from it
+                await res.aread()
+                error = self._get_error(res)
+                if error:
+                    raise error
+
+            f = (
+                await asyncio.to_thread(open, file, "wb")
+                if isinstance(file, (str, os.PathLike))
+                else file
+            )
+            try:
+                async for chunk in res.aiter_bytes(chunk_size=chunk_size):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                if f is not file:
+                    await asyncio.to_thread(f.close)
+        finally:
+            await res.aclose()
+
+    async def get_result(self, uuid: str) -> dict:
+        """Get a result of a scan by UUID.
+
+        Args:
+            uuid (str): UUID.
+
+        Returns:
+            Dict: Scan result.
+
+        Reference:
+            https://urlscan.io/docs/api/#result
+
+        """
+        return await self.get_json(f"/api/v1/result/{uuid}/")
+
+    async def get_screenshot(self, uuid: str) -> BytesIO:
+        """Get a screenshot of a scan by UUID.
+
+        Args:
+            uuid (str): UUID.
+
+        Returns:
+            BytesIO: Screenshot (img/png).
+
+        Reference:
+            https://urlscan.io/docs/api/#screenshot
+
+        """
+        res = await self.get_content(f"/screenshots/{uuid}.png")
+        bio = BytesIO(res)
+        bio.name = f"{uuid}.png"
+        return bio
+
+    async def download_screenshot(
+        self, uuid: str, *, file: BinaryIO | str | os.PathLike
+    ) -> None:
+        """Download a screenshot of a scan by UUID to a file.
+
+        Args:
+            uuid (str): UUID.
+            file (BinaryIO | str | os.PathLike): File object or file path to write to.
+
+        Reference:
+            https://urlscan.io/docs/api/#screenshot
+
+        """
+        await self.download(f"/screenshots/{uuid}.png", file=file)
+
+    async def get_dom(self, uuid: str) -> str:
+        """Get a DOM of a scan by UUID.
+
+        Args:
+            uuid (str): UUID
+
+        Returns:
+            str: DOM as a string.
+
+        Reference:
+            https://urlscan.io/docs/api/#dom
+
+        """
+        return await self.get_text(f"/dom/{uuid}/")
+
+    async def get_response(self, file_hash: str) -> str:
+        """Get a (Script|Document|Fetch|XHR) response in plain text format by SHA256 hash.
+
+        Args:
+            file_hash (str): SHA256 hash of the response.
+
+        Returns:
+            str: Response content as a string.
+
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/scanning/response
+
+        """
+        return await self.get_text(f"/responses/{file_hash}/")
+
+    def search(
+        self,
+        q: str = "",
+        size: int = 100,
+        limit: int | None = None,
+        search_after: str | None = None,
+        datasource: SearchDataSource | None = None,
+        collapse: str | None = None,
+        prefetch: bool = False,
+    ) -> AsyncSearchIterator:
+        """Search.
+
+        Args:
+            q (str): Query term. Defaults to "".
+            size (int, optional): Number of results returned in a search. Defaults to 100.
+            limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
+            search_after (str | None, optional): Search after to retrieve next results. Defaults to None.
+            datasource (SearchDataSource | None, optional): Datasources to search: scans (urlscan.io), hostnames, incidents, notifications, certificates (urlscan Pro). Defaults to None.
+            collapse (str | None, optional): Field to collapse results on. Only works on current page of results. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background task while the current page is being consumed. Defaults to False.
+
+        Returns:
+            AsyncSearchIterator: Async search iterator.
+
+        Reference:
+            https://urlscan.io/docs/api/#search
+
+        """
+        return AsyncSearchIterator(
+            self,
+            path="/api/v1/search/",
+            q=q,
+            size=size,
+            limit=limit,
+            search_after=search_after,
+            datasource=datasource,
+            collapse=collapse,
+            prefetch=prefetch,
+        )
+
+    async def scan(
+        self,
+        url: str,
+        *,
+        visibility: VisibilityType,
+        tags: list[str] | None = None,
+        customagent: str | None = None,
+        referer: str | None = None,
+        override_safety: Any = None,
+        country: str | None = None,
+    ) -> dict:
+        """Scan a given URL.
+
+        Args:
+            url (str): URL to scan.
+            visibility (VisibilityType): Visibility of the scan. Can be "public", "private", or "unlisted".
+            tags (list[str] | None, optional): Tags to be attached. Defaults to None.
+            customagent (str | None, optional): Custom user agent. Defaults to None.
+            referer (str | None, optional): Referer. Defaults to None.
+            override_safety (Any, optional): If set to any value, this will disable reclassification of URLs with potential PII in them. Defaults to None.
+            country (str | None, optional): Specify which country the scan should be performed from (2-Letter ISO-3166-1 alpha-2 country. Defaults to None.
+
+        Returns:
+            dict: Scan response.
+
+        Reference:
+            https://urlscan.io/docs/api/#scan
+
+        """
+        data = {
+            k: v
+            for k, v in (
+                ("url", url),
+                ("tags", tags),
+                ("visibility", visibility),
+                ("customagent", customagent),
+                ("referer", referer),
+                ("overrideSafety", override_safety),
+                ("country", country),
+            )
+            if v is not None
+        }
+        res = await self._post("/api/v1/scan/", json=data, action=visibility)
+        json_res = self._response_to_json(res)
+
+        json_visibility = json_res.get("visibility")
+        if json_visibility is not None and json_visibility != visibility:
+            logger.warning(f"Visibility is enforced to {json_visibility}.")
+
+        # memoize the scan UUID & timestamp
+        uuid = json_res.get("uuid")
+        if isinstance(uuid, str):
+            self._memoize_scan_uuid(uuid)
+
+        return json_res
+
+    async def wait_for_result(
+        self,
+        uuid: str,
+        timeout: float = 60.0,
+        interval: float = 1.0,
+        initial_wait: float | None = 10.0,
+        max_interval: float = 8.0,
+    ) -> None:
+        """Wait for a scan result to be available.
+
+        The polling interval grows exponentially (with jitter) from interval up to max_interval.
+
+        Args:
+            uuid (str): UUID of a result.
+            timeout (float, optional): Timeout in seconds. Defaults to 60.0.
+            interval (float, optional): Initial interval in seconds. Defaults to 1.0.
+            initial_wait (float | None, optional): Initial wait time in seconds. Set None to disable. Defaults to 10.0.
+            max_interval (float, optional): Maximum interval in seconds. Defaults to 8.0.
+
+        """
+        req = self._session.build_request("HEAD", f"/api/v1/result/{uuid}/")
+
+        scanned_at = self._get_scan_timestamp(uuid)
+        if scanned_at and initial_wait:
+            elapsed = time.time() - scanned_at
+            if elapsed < initial_wait:
+                await asyncio.sleep(initial_wait - elapsed)
+
+        start_time = time.time()
+        attempts = 0
+        while True:
+            res = await self._send_request(req)
+            if res.status_code == 200:
+                self._forget_scan_uuid(uuid)
+                return
+
+            if time.time() - start_time > timeout:
+                raise TimeoutError("Timeout waiting for scan result.")
+
+            await asyncio.sleep(_backoff(interval, max_interval, attempts))
+            attempts += 1
+
+    async def scan_and_get_result(
+        self,
+        url: str,
+        visibility: VisibilityType,
+        tags: list[str] | None = None,
+        customagent: str | None = None,
+        referer: str | None = None,
+        override_safety: Any = None,
+        country: str | None = None,
+        timeout: float = 60.0,
+        interval: float = 1.0,
+        initial_wait: float | None = 10.0,
+    ) -> dict:
+        """Scan a given URL, wait for a result and get it.
+
+        Args:
+            url (str): URL to scan.
+            visibility (VisibilityType): Visibility of the scan. Can be "public", "private", or "unlisted".
+            tags (list[str] | None, optional): Tags to be attached. Defaults to None.
+            customagent (str | None, optional): Custom user agent. Defaults to None.
+            referer (str | None, optional): Referer. Defaults to None.
+            override_safety (Any, optional): If set to any value, this will disable reclassification of URLs with potential PII in them. Defaults to None.
+            country (str | None, optional): Specify which country the scan should be performed from (2-Letter ISO-3166-1 alpha-2 country. Defaults to None.
+            timeout (float, optional): Timeout for waiting a result in seconds. Defaults to 60.0.
+            interval (float, optional): Interval in seconds. Defaults to 1.0.
+            initial_wait (float | None, optional): Initial wait time in seconds. Set None to disable. Defaults to 10.0.
+
+        Returns:
+            dict: Scan result.
+
+        Reference:
+            https://urlscan.io/docs/api/#scan
+
+        """
+        res = await self.scan(
+            url,
+            visibility=visibility,
+            tags=tags,
+            customagent=customagent,
+            referer=referer,
+            override_safety=override_safety,
+            country=country,
+        )
+        uuid: str = res["uuid"]
+        await self.wait_for_result(
+            uuid, timeout=timeout, interval=interval, initial_wait=initial_wait
+        )
+        return await self.get_result(uuid)
+
+    async def get_available_countries(self) -> dict:
+        """Retrieve countries available for scanning using the Scan API.
+
+        Returns:
+            dict: Available countries.
+
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/scanning/availablecountries
+
+        """
+        return await self.get_json("/api/v1/availableCountries")
+
+    async def get_user_agents(self) -> dict:
+        """Get grouped user agents to use with the Scan API.
+
+        Returns:
+            dict: Available user agents.
+
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/scanning/useragents
+
+        """
+        return await self.get_json("/api/v1/userAgents")
+
+    async def get_quotas(self) -> dict:
+        """Get available and used API quotas.
+
+        Returns:
+            dict: API quotas.
+
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/generic/quotas
+
+        """
+        return await self.get_json("/api/v1/quotas")
@@ -1,63 +1,207 @@
 """Client module for urlscan.io API."""
 
-import contextlib
+import atexit
 import datetime
 import json
 import logging
 import os
+import random
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Any, BinaryIO, Literal, TypedDict, cast
+from typing import Any, BinaryIO, Literal, TypedDict, TypeVar, cast, get_args
 
 import httpx
 from httpx._types import QueryParamTypes, RequestData, TimeoutTypes
 
+from ._compat import orjson
 from ._version import version
 from .error import APIError, ItemError, RateLimitError, RateLimitRemainingError
 from .iterator import SearchIterator
 from .types import ActionType, SearchDataSource, VisibilityType
-from .utils import _compact, _parse_datetime
+from .utils import _backoff, _LRUCache, _parse_datetime, _parse_retry_after
 
 logger = logging.getLogger("urlscan-python")
 
 BASE_URL = os.environ.get("URLSCAN_BASE_URL", "https://urlscan.io")
 USER_AGENT = f"urlscan-py/{version}"
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# httpx's default pool size with a longer keep-alive, so that connections survive
+# between pages / polls instead of paying for new TCP/TLS handshakes
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# bounds of the scan UUID -> timestamp memo used for initial waits
+SCAN_UUID_MEMO_MAXSIZE = 4096
+SCAN_UUID_MEMO_TTL = 3600.0
+
+# lifetime of cached reference data responses (e.g. scanners, watchable attributes)
+JSON_CACHE_TTL = 300.0
+
 
 class RetryTransport(httpx.HTTPTransport):
     """HTTP transport with automatic retry on rate limit (429) responses."""
 
+    def __init__(
+        self,
+        *args: Any,
+        jitter: float = 0.5,
+        max_retries: int = 10,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        connect_retries: int = 3,
+        **kwargs: Any,
+    ):
+        """Initialize the transport.
+
+        Args:
+            *args: Positional arguments passed to httpx.HTTPTransport.
+            jitter (float, optional): Maximum random delay in seconds added to X-Rate-Limit-Reset-After. Defaults to 0.5.
+            max_retries (int, optional): Maximum number of retries on rate limit. The last 429 response is returned once it's exceeded. Defaults to 10.
+            base_delay (float, optional): Initial delay in seconds of the exponential backoff. Defaults to 1.0.
+            max_delay (float, optional): Maximum delay in seconds of the exponential backoff. Defaults to 30.0.
+            connect_retries (int, optional): Number of retries on connection errors (e.g. DNS or TCP connect failures). It's handled by httpx (httpcore) and independent from retries on rate limit. `retries` of httpx.HTTPTransport is accepted as an alias. Defaults to 3.
+            **kwargs: Keyword arguments passed to httpx.HTTPTransport.
+
+        """
+        # retries of httpx.HTTPTransport is the number of retries on connection errors
+        connect_retries = kwargs.pop("retries", connect_retries)
+        super().__init__(*args, retries=connect_retries, **kwargs)
+        self._jitter = jitter
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    def _get_delay(self, rate_limit_reset_after: float | None, retries: int) -> float:
+        if rate_limit_reset_after is None:
+            # fallback to exponential backoff (with jitter) when the server hint is missing
+            return _backoff(self._base_delay, self._max_delay, retries)
+
+        # add a random jitter to spread retries of clients hitting the same reset time
+        return rate_limit_reset_after + random.uniform(0, self._jitter)
+
     def handle_request(self, request: httpx.Request) -> httpx.Response:
         """Handle request with automatic retry on rate limit."""
-        res = super().handle_request(request)
-        if res.status_code == 429:
-            rate_limit_reset_after: str | None = res.headers.get(
-                "X-Rate-Limit-Reset-After"
-            )
-            if rate_limit_reset_after is None:
+        retries = 0
+        while True:
+            res = super().handle_request(request)
+            if res.status_code != 429 or retries >= self._max_retries:
                 return res
 
+            # fallback to the standard Retry-After (e.g. set by a proxy in front of urlscan.io)
+            rate_limit_reset_after = _parse_retry_after(
+                res.headers.get("X-Rate-Limit-Reset-After")
+                or res.headers.get("Retry-After")
+            )
+            delay = self._get_delay(rate_limit_reset_after, retries)
+
+            # drain & close the response to put the connection back to the pool
+            res.read()
+            res.close()
+
             logger.info(
-                f"Rate limit error hit. Wait {rate_limit_reset_after} seconds before retrying..."
+                f"Rate limit error hit. Wait {delay:.2f} seconds before retrying..."
             )
-            time.sleep(float(rate_limit_reset_after))
-            return self.handle_request(request)
+            time.sleep(delay)
+            retries += 1
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Transport forwarding requests to a transport shared by multiple clients.
+
+    Closing it doesn't close the shared transport (and its connection pool).
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        """Initialize with the shared transport."""
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Handle request with the shared transport."""
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Do nothing. The shared transport is closed by close_shared_transports()."""
+
+
+# shared transports keyed by their configuration
+# (they are kept alive after their clients are closed so that short-lived clients reuse them)
+_shared_transports: dict[tuple, httpx.BaseTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def close_shared_transports() -> None:
+    """Close the connection pools shared by clients created by from_shared().
+
+    It's called at exit. A client created by from_shared() after calling it gets a new connection pool.
+    """
+    with _shared_transports_lock:
+        transports = list(_shared_transports.values())
+        _shared_transports.clear()
+
+    for transport in transports:
+        transport.close()
+
+
+atexit.register(close_shared_transports)
+
+
+def _get_shared_transport(
+    *,
+    verify: bool,
+    proxy: str | None,
+    trust_env: bool,
+    retry: bool,
+    limits: httpx.Limits,
+    http2: bool,
+) -> httpx.BaseTransport:
+    key = (
+        verify,
+        proxy,
+        trust_env,
+        retry,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+    )
+    with _shared_transports_lock:
+        transport = _shared_transports.get(key)
+        if transport is None:
+            transport_cls = RetryTransport if retry else httpx.HTTPTransport
+            transport = transport_cls(
+                verify=verify,
+                proxy=proxy,
+                trust_env=trust_env,
+                limits=limits,
+                http2=http2,
+            )
+            _shared_transports[key] = transport
+
+        return transport
 
-        return res
+
+# sentinel for a value not computed yet (None is a valid JSON value)
+_UNSET: Any = object()
 
 
 class ClientResponse:
     """Wrapper for httpx.Response providing a simplified interface."""
 
+    # a wrapper is allocated per request, so keep it lightweight
+    __slots__ = ("_json", "_res")
+
     def __init__(self, res: httpx.Response):
         """Initialize with an httpx Response object."""
         self._res = res
-
-    @property
-    def basename(self) -> str:
-        """Return the basename of the response URL path."""
-        return os.path.basename(self._res.url.path)
+        self._json: Any = _UNSET
 
     @property
     def content(self) -> bytes:
@@ -65,8 +209,17 @@ class ClientResponse:
         return self._res.content
 
     def json(self) -> Any:
-        """Return the response content parsed as JSON."""
-        return self._res.json()
+        """Return the response content parsed as JSON.
+
+        orjson is used for parsing if it's installed. The parsed content is cached.
+        """
+        if self._json is _UNSET:
+            if orjson is not None:
+                self._json = orjson.loads(self._res.content)
+            else:
+                self._json = self._res.json()
+
+        return self._json
 
     @property
     def text(self) -> str:
@@ -87,13 +240,38 @@ class ClientResponse:
         """Raise an exception for HTTP error responses."""
         self._res.raise_for_status()
 
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the response content in chunks."""
+        return self._res.iter_bytes(chunk_size=chunk_size)
+
+    def read(self) -> bytes:
+        """Read the (streamed) response content."""
+        return self._res.read()
+
+    def close(self) -> None:
+        """Close the response and release the connection."""
+        self._res.close()
+
+    def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        """Iterate over the response content in chunks asynchronously."""
+        return self._res.aiter_bytes(chunk_size=chunk_size)
+
+    async def aread(self) -> bytes:
+        """Read the (streamed) response content asynchronously."""
+        return await self._res.aread()
+
+    async def aclose(self) -> None:
+        """Close the response and release the connection asynchronously."""
+        await self._res.aclose()
+
 
 @dataclass
 class RateLimit:
     """Data class representing rate limit information."""
 
     remaining: int
-    reset: datetime.datetime
+    # unix timestamp (seconds) of when the rate limit resets
+    reset: float
 
 
 class RateLimitMemo(TypedDict):
@@ -106,10 +284,210 @@ class RateLimitMemo(TypedDict):
     search: RateLimit | None
 
 
+_T = TypeVar("_T", bound="BaseClient")
+
+
+def _build_request(
+    session: httpx.Client | httpx.AsyncClient,
+    method: str,
+    path: str,
+    json: Any | None = None,
+    data: RequestData | None = None,
+) -> httpx.Request:
+    # encode the JSON body with orjson if it's installed (httpx uses the stdlib json)
+    if json is not None and orjson is not None:
+        return session.build_request(
+            method,
+            path,
+            content=orjson.dumps(json),
+            data=data,
+            headers={"Content-Type": "application/json"},
+        )
+
+    return session.build_request(method, path, json=json, data=data)
+
+
 RateLimitKey = Literal["public", "private", "unlisted", "retrieve", "search"]
+RATE_LIMIT_KEYS: frozenset[str] = frozenset(get_args(RateLimitKey))
+
+
+class _ClientMixin:
+    """Request & response handling (without I/O) shared by the sync and async clients."""
+
+    _rate_limit_memo: RateLimitMemo
+    _scan_uuid_timestamp_memo: OrderedDict[str, float]
+    _scan_uuid_timestamp_memo_lock: threading.Lock
+
+    def _get_action(self, request: httpx.Request) -> ActionType | None:
+        # use the action stashed when building the request (if any)
+        action: ActionType | None = request.extensions.get("urlscan_action")
+        if action:
+            return action
+
+        path = request.url.path
+        if request.method == "GET":
+            if path == "/api/v1/search/":
+                return "search"
+
+            if path.startswith("/api/v1/result/"):
+                return "retrieve"
+
+            return None
+
+        if request.method == "POST":
+            if path != "/api/v1/scan/":
+                return None
+
+            if request.headers.get("Content-Type") != "application/json":
+                return None
+
+            try:
+                data: dict = json.loads(request.content)
+            except json.JSONDecodeError:
+                return None
+
+            return data.get("visibility")
+
+        return None
+
+    def _check_rate_limit(self, request: httpx.Request) -> None:
+        action = self._get_action(request)
+        if not action:
+            return
+
+        rate_limit: RateLimit | None = self._rate_limit_memo.get(action)
+        if rate_limit and rate_limit.remaining == 0 and rate_limit.reset > time.time():
+            reset_at = datetime.datetime.fromtimestamp(
+                rate_limit.reset, tz=datetime.timezone.utc
+            )
+            raise RateLimitRemainingError(
+                f"{action} is rate limited. Wait until {reset_at}."
+            )
+
+    def _memoize_rate_limit(self, res: ClientResponse) -> None:
+        # use action in response headers
+        action = res.headers.get("X-Rate-Limit-Action")
+        # ignore unknown actions not to corrupt the memo
+        if action not in RATE_LIMIT_KEYS:
+            return
+
+        remaining = res.headers.get("X-Rate-Limit-Remaining")
+        reset = res.headers.get("X-Rate-Limit-Reset")
+        if remaining and reset:
+            self._rate_limit_memo[cast(RateLimitKey, action)] = RateLimit(
+                remaining=int(remaining),
+                reset=_parse_datetime(reset).timestamp(),
+            )
+
+    def _memoize_scan_uuid(self, uuid: str) -> None:
+        now = time.time()
+        memo = self._scan_uuid_timestamp_memo
+        with self._scan_uuid_timestamp_memo_lock:
+            memo[uuid] = now
+            memo.move_to_end(uuid)
+
+            # evict expired & overflowing entries (the oldest ones are at the front)
+            while memo:
+                oldest_uuid, scanned_at = next(iter(memo.items()))
+                if (
+                    now - scanned_at <= SCAN_UUID_MEMO_TTL
+                    and len(memo) <= SCAN_UUID_MEMO_MAXSIZE
+                ):
+                    break
+
+                del memo[oldest_uuid]
+
+    def _get_scan_timestamp(self, uuid: str) -> float | None:
+        with self._scan_uuid_timestamp_memo_lock:
+            return self._scan_uuid_timestamp_memo.get(uuid)
+
+    def _forget_scan_uuid(self, uuid: str) -> None:
+        with self._scan_uuid_timestamp_memo_lock:
+            self._scan_uuid_timestamp_memo.pop(uuid, None)
+
+    def _map_error_response(self, res: ClientResponse) -> APIError:
+        data: dict = res.json()
+        message: str = data["message"]
+        description: str | None = data.get("description")
+        code: str | None = data.get("code")
+        type_: str | None = data.get("type")
+        # fallback to HTTP status code if "status" is missing
+        status: int = data.get("status") or res.status_code
+
+        # ref. https://urlscan.io/docs/api/#ratelimit
+        if status == 429:
+            rate_limit_reset_after = float(
+                res.headers.get("X-Rate-Limit-Reset-After", 0)
+            )
+            return RateLimitError(
+                message,
+                description=description,
+                status=status,
+                rate_limit_reset_after=rate_limit_reset_after,
+            )
+
+        def mapper(d: dict) -> ItemError:
+            title: str = d["title"]
+            status: int = d["status"]
+            code: str | None = d.get("code")
+            description: str | None = d.get("description")
+            detail: str | None = d.get("detail")
+            return ItemError(
+                title=title,
+                description=description,
+                detail=detail,
+                status=status,
+                code=code,
+            )
+
+        errors: list[ItemError] | None = None
+        if "errors" in data:
+            errors = [mapper(item) for item in data["errors"]]
 
+        return APIError(
+            message,
+            description=description,
+            status=status,
+            code=code,
+            type_=type_,
+            errors=errors,
+        )
 
-class BaseClient:
+    def _get_error(self, res: ClientResponse) -> APIError | None:
+        status_code = res.status_code
+        if 200 <= status_code < 300:
+            return None
+
+        try:
+            return self._map_error_response(res)
+        except (ValueError, KeyError, TypeError):
+            # when error response is not JSON (JSONDecodeError & UnicodeDecodeError are ValueError)
+            # or it's JSON but not in the API error format (e.g. from a proxy)
+            return APIError(message=res.text, status=status_code)
+
+    def _response_to_json(self, res: ClientResponse) -> dict:
+        error = self._get_error(res)
+        if error:
+            raise error
+
+        return res.json()
+
+    def _response_to_str(self, res: ClientResponse) -> str:
+        error = self._get_error(res)
+        if error:
+            raise error
+
+        return res.text
+
+    def _response_to_content(self, res: ClientResponse) -> bytes:
+        error = self._get_error(res)
+        if error:
+            raise error
+
+        return res.content
+
+
+class BaseClient(_ClientMixin):
     """Base client for urlscan.io API with common HTTP operations."""
 
     def __init__(
@@ -123,6 +501,11 @@ class BaseClient:
         verify: bool = True,
         retry: bool = False,
         follow_redirects: bool = True,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        result_cache_size: int = 0,
+        etag_cache_size: int = 0,
+        transport: httpx.BaseTransport | None = None,
     ):
         """Initialize the base client.
 
@@ -136,6 +519,11 @@ class BaseClient:
             verify (bool, optional): Either `True` to use an SSL context with the default CA bundle, `False` to disable verification. Defaults to True.
             retry (bool, optional): Whether to use automatic X-Rate-Limit-Reset-After HTTP header based retry. Defaults to False.
             follow_redirects (bool, optional): Whether to follow redirects. Defaults to True.
+            limits (httpx.Limits | None, optional): Connection pool limits. Set larger limits when sending many requests concurrently. Defaults to None (DEFAULT_LIMITS).
+            http2 (bool, optional): Whether to enable HTTP/2 to multiplex concurrent requests over a single connection. Requires the `http2` extra. Defaults to False.
+            result_cache_size (int, optional): Maximum number of scan results cached by UUID (least recently used ones are evicted). Set 0 to disable. Defaults to 0.
+            etag_cache_size (int, optional): Maximum number of JSON responses cached by URL along with their ETag. A cached response is revalidated with If-None-Match and reused on 304 Not Modified. Set 0 to disable. Defaults to 0.
+            transport (httpx.BaseTransport | None, optional): Transport to send requests with. verify, proxy, retry, limits and http2 are not applied to it. Defaults to None.
 
         """
         self._api_key = api_key
@@ -147,8 +535,11 @@ class BaseClient:
         self._verify = verify
         self._retry = retry
         self._follow_redirects = follow_redirects
+        self._limits = limits or DEFAULT_LIMITS
+        self._http2 = http2
+        self._transport = transport
 
-        self._session: httpx.Client | None = None
+        self._session = self._build_session()
         self._rate_limit_memo: RateLimitMemo = {
             "public": None,
             "private": None,
@@ -157,7 +548,52 @@ class BaseClient:
             "search": None,
         }
 
-        self._scan_uuid_timestamp_memo: dict[str, float] = {}
+        # scan UUID -> timestamp, ordered by insertion (oldest first)
+        self._scan_uuid_timestamp_memo: OrderedDict[str, float] = OrderedDict()
+        self._scan_uuid_timestamp_memo_lock = threading.Lock()
+        self._result_cache = _LRUCache(result_cache_size)
+        self._etag_cache_size = etag_cache_size
+        # URL -> (ETag, response)
+        self._etag_cache = _LRUCache(etag_cache_size)
+        # path -> (timestamp, response) of rarely changing reference data
+        self._json_cache: dict[str, tuple[float, dict]] = {}
+
+    @classmethod
+    def from_shared(cls: type[_T], api_key: str, **kwargs: Any) -> _T:
+        """Create a client sharing its connection pool with other clients created by this method.
+
+        Clients with the same verify, proxy, trust_env, retry, limits and http2 settings reuse the same
+        connection pool, so creating a client doesn't pay for new TCP/TLS handshakes.
+        Closing a client doesn't close the shared connection pool. It's kept alive until
+        close_shared_transports() is called (at exit).
+
+        Examples:
+            >>> from urlscan import Client
+            >>> with Client.from_shared("<your_api_key>") as client:
+            ...     client.get_result("<uuid>")
+
+        Args:
+            api_key (str): Your urlscan.io API key.
+            **kwargs: Keyword arguments passed to the constructor (except transport).
+
+        Returns:
+            A client instance.
+
+        """
+        if "transport" in kwargs:
+            raise TypeError(
+                "from_shared() got an unexpected keyword argument 'transport'"
+            )
+
+        transport = _get_shared_transport(
+            verify=kwargs.get("verify", True),
+            proxy=kwargs.get("proxy"),
+            trust_env=kwargs.get("trust_env", False),
+            retry=kwargs.get("retry", False),
+            limits=kwargs.get("limits") or DEFAULT_LIMITS,
+            http2=kwargs.get("http2", False),
+        )
+        return cls(api_key, transport=_SharedTransport(transport), **kwargs)
 
     def __enter__(self):
         """Enter the context manager."""
@@ -168,90 +604,56 @@ class BaseClient:
         self._close()
 
     def _close(self):
-        if self._session:
-            self._session.close()
-            self._session = None
-
-    def _get_session(self) -> httpx.Client:
-        if self._session:
-            return self._session
-
-        headers = _compact(
-            {
-                "User-Agent": self._user_agent,
-                "API-Key": self._api_key,
-            }
-        )
-        transport: httpx.HTTPTransport | None = None
-        if self._retry:
-            transport = RetryTransport()
+        self._session.close()
+
+    def _build_session(self) -> httpx.Client:
+        headers = {
+            "User-Agent": self._user_agent,
+            "API-Key": self._api_key,
+        }
+        transport = self._transport
+        # build the transport here so that it can be shared with other clients (e.g. Pro sub-clients)
+        # (with trust_env, it's left to httpx.Client as proxies are taken from the environment
+        # only for a transport built by httpx.Client)
+        if transport is None and (self._retry or not self._trust_env):
+            # httpx.Client doesn't apply its transport options to a custom transport
+            transport_cls = RetryTransport if self._retry else httpx.HTTPTransport
+            transport = transport_cls(
+                verify=self._verify,
+                proxy=self._proxy,
+                trust_env=self._trust_env,
+                limits=self._limits,
+                http2=self._http2,
+            )
 
-        self._session = httpx.Client(
+        # None if the transport is built by httpx.Client
+        self._session_transport = transport
+
+        return httpx.Client(
             base_url=self._base_url,
             headers=headers,
             timeout=self._timeout,
-            proxy=self._proxy,
+            # a proxy given to httpx.Client is mounted for all URLs and takes precedence over
+            # the transport, so a custom transport has to route the proxy by itself
+            proxy=self._proxy if transport is None else None,
             verify=self._verify,
             trust_env=self._trust_env,
             transport=transport,
             follow_redirects=self._follow_redirects,
+            limits=self._limits,
+            http2=self._http2,
         )
-        return self._session
-
-    def _get_action(self, request: httpx.Request) -> ActionType | None:
-        path = request.url.path
-        if request.method == "GET":
-            if path == "/api/v1/search/":
-                return "search"
-
-            if path.startswith("/api/v1/result/"):
-                return "retrieve"
-
-            return None
-
-        if request.method == "POST":
-            if path != "/api/v1/scan/":
-                return None
-
-            if request.headers.get("Content-Type") != "application/json":
-                return None
-
-            with contextlib.suppress(json.JSONDecodeError):
-                data: dict = json.loads(request.content)
-                return data.get("visibility")
-
-        return None
 
     def _send_request(
-        self, session: httpx.Client, request: httpx.Request
+        self, session: httpx.Client, request: httpx.Request, *, stream: bool = False
     ) -> ClientResponse:
         # let it automatic retry if retry is enabled
         if self._retry:
-            return ClientResponse(session.send(request))
-
-        action = self._get_action(request)
-        if action:
-            rate_limit: RateLimit | None = self._rate_limit_memo.get(action)
-            if rate_limit:
-                utcnow = datetime.datetime.now(datetime.timezone.utc)
-                if rate_limit.remaining == 0 and rate_limit.reset > utcnow:
-                    raise RateLimitRemainingError(
-                        f"{action} is rate limited. Wait until {utcnow}."
-                    )
-
-        res = ClientResponse(session.send(request))
-
-        # use action in response headers
-        action = cast(RateLimitKey | None, res.headers.get("X-Rate-Limit-Action"))
-        if action:
-            remaining = res.headers.get("X-Rate-Limit-Remaining")
-            reset = res.headers.get("X-Rate-Limit-Reset")
-            if remaining and reset:
-                self._rate_limit_memo[action] = RateLimit(
-                    remaining=int(remaining),
-                    reset=_parse_datetime(reset),
-                )
+            return ClientResponse(session.send(request, stream=stream))
 
+        self._check_rate_limit(request)
+        res = ClientResponse(session.send(request, stream=stream))
+        self._memoize_rate_limit(res)
         return res
 
     def _get(self, path: str, params: QueryParamTypes | None = None) -> ClientResponse:
@@ -265,20 +667,59 @@ class BaseClient:
             ClientResponse: Response.
 
         """
-        session = self._get_session()
+        session = self._session
         req = session.build_request("GET", path, params=params)
         return self._send_request(session, req)
 
     def get_json(self, path: str, params: QueryParamTypes | None = None) -> dict:
-        """Send a GET request and return the JSON response."""
-        res = self._get(path, params=params)
-        return self._response_to_json(res)
+        """Send a GET request and return the JSON response.
+
+        If the ETag cache is enabled, a cached response is revalidated with If-None-Match
+        and returned as it is when the server replies 304 Not Modified.
+        """
+        if self._etag_cache_size <= 0:
+            res = self._get(path, params=params)
+            return self._response_to_json(res)
+
+        session = self._session
+        req = session.build_request("GET", path, params=params)
+        key = str(req.url)
+        cached: tuple[str, dict] | None = self._etag_cache.get(key)
+        if cached is not None:
+            req.headers["If-None-Match"] = cached[0]
+
+        res = self._send_request(session, req)
+        if cached is not None and res.status_code == 304:
+            return cached[1]
+
+        data = self._response_to_json(res)
+        etag = res.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(key, (etag, data))
+
+        return data
+
+    def _get_cached_json(self, path: str, ttl: float = JSON_CACHE_TTL) -> dict:
+        now = time.monotonic()
+        cached = self._json_cache.get(path)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        data = self.get_json(path)
+        self._json_cache[path] = (now, data)
+        return data
+
+    def clear_cache(self) -> None:
+        """Clear the cached reference data responses (e.g. brands, scanners) and the ETag cache."""
+        self._json_cache.clear()
+        self._etag_cache.clear()
 
     def _post(
         self,
         path: str,
         json: Any | None = None,
         data: RequestData | None = None,
+        action: ActionType | None = None,
     ) -> ClientResponse:
         """Send a POST request to a given API endpoint.
 
@@ -286,13 +727,17 @@ class BaseClient:
             path (str): Path.
             json (Any | None, optional): Dict to send in request body as JSON. Defaults to None.
             data (RequestData | None, optional): Dict to send in request body. Defaults to None.
+            action (ActionType | None, optional): Rate limit action of the request. It saves re-parsing the request body to find it. Defaults to None.
 
         Returns:
             ClientResponse: Response.
 
         """
-        session = self._get_session()
-        req = session.build_request("POST", path, json=json, data=data)
+        session = self._session
+        req = _build_request(session, "POST", path, json=json, data=data)
+        if action:
+            req.extensions["urlscan_action"] = action
+
         return self._send_request(session, req)
 
     def _put(
@@ -312,8 +757,8 @@ class BaseClient:
             ClientResponse: Response.
 
         """
-        session = self._get_session()
-        req = session.build_request("PUT", path, json=json, data=data)
+        session = self._session
+        req = _build_request(session, "PUT", path, json=json, data=data)
         return self._send_request(session, req)
 
     def _delete(
@@ -331,34 +776,49 @@ class BaseClient:
             ClientResponse: Response.
 
         """
-        session = self._get_session()
+        session = self._session
         req = session.build_request("DELETE", path, params=params)
         return self._send_request(session, req)
 
     def download(
         self,
         path: str,
-        file: BinaryIO,
+        file: BinaryIO | str | os.PathLike,
         params: QueryParamTypes | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> None:
         """Download a file from a given API endpoint.
 
+        The response body is streamed and written to the file chunk by chunk,
+        so the whole file is never held in memory.
+
         Args:
             path (str): Path to API endpoint.
-            file (BinaryIO): File object to write to.
+            file (BinaryIO | str | os.PathLike): File object or file path to write to. A file path is opened (and truncated) only after a successful response.
             params (QueryParamTypes | None, optional): Query parameters. Defaults to None.
-
-        Returns:
-            BytesIO: File content.
+            chunk_size (int, optional): Size of chunks in bytes to write. Defaults to DEFAULT_CHUNK_SIZE (64 KiB).
 
         """
-        res = self._get(path, params=params)
-        error = self._get_error(res)
-        if error:
-            raise error
-
-        file.write(res.content)
-        return
+        session = self._session
+        req = session.build_request("GET", path, params=params)
+        res = self._send_request(session, req, stream=True)
+        try:
+            if not 200 <= res.status_code < 300:
+                # read the error (or redirect) response to build an error from it
+                res.read()
+                error = self._get_error(res)
+                if error:
+                    raise error
+
+            f = open(file, "wb") if isinstance(file, (str, os.PathLike)) else file  # noqa: SIM115
+            try:
+                for chunk in res.iter_bytes(chunk_size=chunk_size):
+                    f.write(chunk)
+            finally:
+                if f is not file:
+                    f.close()
+        finally:
+            res.close()
 
     def get_content(self, path: str, params: QueryParamTypes | None = None) -> bytes:
         """Send a GET request and return the response content as bytes."""
@@ -370,108 +830,63 @@ class BaseClient:
         res = self._get(path, params=params)
         return self._response_to_str(res)
 
-    def _map_http_status_error(self, exc: httpx.HTTPStatusError) -> APIError:
-        data: dict = exc.response.json()
-        message: str = data["message"]
-        description: str | None = data.get("description")
-        code: str | None = data.get("code")
-        type_: str | None = data.get("type")
-        # fallback to HTTP status code if "status" is missing
-        status: int = data.get("status") or exc.response.status_code
 
-        # ref. https://urlscan.io/docs/api/#ratelimit
-        if status == 429:
-            rate_limit_reset_after = float(
-                exc.response.headers.get("X-Rate-Limit-Reset-After", 0)
-            )
-            return RateLimitError(
-                message,
-                description=description,
-                status=status,
-                rate_limit_reset_after=rate_limit_reset_after,
-            )
-
-        def mapper(d: dict) -> ItemError:
-            title: str = d["title"]
-            status: int = d["status"]
-            code: str | None = d.get("code")
-            description: str | None = d.get("description")
-            detail: str | None = d.get("detail")
-            return ItemError(
-                title=title,
-                description=description,
-                detail=detail,
-                status=status,
-                code=code,
-            )
-
-        errors: list[ItemError] | None = None
-        if "errors" in data:
-            errors = [mapper(item) for item in data["errors"]]
-
-        return APIError(
-            message,
-            description=description,
-            status=status,
-            code=code,
-            type_=type_,
-            errors=errors,
-        )
-
-    def _get_error(self, res: ClientResponse) -> APIError | None:
-        try:
-            res.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            try:
-                return self._map_http_status_error(exc)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # when error response is not JSON
-                return APIError(
-                    message=exc.response.text,
-                    status=exc.response.status_code,
-                )
-
-        return None
-
-    def _response_to_json(self, res: ClientResponse) -> dict:
-        error = self._get_error(res)
-        if error:
-            raise error
+class Client(BaseClient):
+    """Main client for urlscan.io API."""
 
-        return res.json()
+    def get_result(self, uuid: str) -> dict:
+        """Get a result of a scan by UUID.
 
-    def _response_to_str(self, res: ClientResponse) -> str:
-        error = self._get_error(res)
-        if error:
-            raise error
+        Args:
+            uuid (str): UUID.
 
-        return res.text
+        Returns:
+            Dict: Scan result.
 
-    def _response_to_content(self, res: ClientResponse) -> bytes:
-        error = self._get_error(res)
-        if error:
-            raise error
+        Reference:
+            https://urlscan.io/docs/api/#result
 
-        return res.content
+        """
+        result: dict | None = self._result_cache.get(uuid)
+        if result is not None:
+            return result
 
+        result = self.get_json(f"/api/v1/result/{uuid}/")
+        self._result_cache.set(uuid, result)
+        return result
 
-class Client(BaseClient):
-    """Main client for urlscan.io API."""
+    def bulk_get_result(
+        self, uuids: list[str], *, max_workers: int = 4
+    ) -> list[tuple[str, dict | Exception]]:
+        """Get results of multiple scans concurrently.
 
-    def get_result(self, uuid: str) -> dict:
-        """Get a result of a scan by UUID.
+        Requests are sent from a thread pool sharing the client's connection pool.
+        With retry enabled, a rate limited request is retried in its own worker without blocking the others.
 
         Args:
-            uuid (str): UUID.
+            uuids (list[str]): List of UUIDs.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 4.
 
         Returns:
-            Dict: Scan result.
+            list[tuple[str, dict | Exception]]: A list of tuples of (uuid, scan result or error).
 
         Reference:
             https://urlscan.io/docs/api/#result
 
         """
-        return self.get_json(f"/api/v1/result/{uuid}/")
+
+        def inner(uuid: str) -> dict | Exception:
+            try:
+                return self.get_result(uuid)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(zip(uuids, executor.map(inner, uuids), strict=True))
+
+    def clear_result_cache(self) -> None:
+        """Clear the cache of scan results."""
+        self._result_cache.clear()
 
     def get_screenshot(self, uuid: str) -> BytesIO:
         """Get a screenshot of a scan by UUID.
@@ -491,6 +906,28 @@ class Client(BaseClient):
         bio.name = f"{uuid}.png"
         return bio
 
+    def download_screenshot(
+        self, uuid: str, *, file: BinaryIO | str | os.PathLike
+    ) -> None:
+        """Download a screenshot of a scan by UUID to a file.
+
+        Unlike get_screenshot, the screenshot is streamed to the file without being buffered in memory.
+
+        Examples:
+            >>> from urlscan import Client
+            >>> with Client("<your_api_key>") as client, open("screenshot.png", "wb") as f:
+            ...     client.download_screenshot("<uuid>", file=f)
+
+        Args:
+            uuid (str): UUID.
+            file (BinaryIO | str | os.PathLike): File object or file path to write to.
+
+        Reference:
+            https://urlscan.io/docs/api/#screenshot
+
+        """
+        self.download(f"/screenshots/{uuid}.png", file=file)
+
     def get_dom(self, uuid: str) -> str:
         """Get a DOM of a scan by UUID.
 
@@ -529,6 +966,7 @@ class Client(BaseClient):
         search_after: str | None = None,
         datasource: SearchDataSource | None = None,
         collapse: str | None = None,
+        prefetch: bool = False,
     ) -> SearchIterator:
         """Search.
 
@@ -539,6 +977,7 @@ class Client(BaseClient):
             search_after (str | None, optional): Search after to retrieve next results. Defaults to None.
             datasource (SearchDataSource | None, optional): Datasources to search: scans (urlscan.io), hostnames, incidents, notifications, certificates (urlscan Pro). Defaults to None.
             collapse (str | None, optional): Field to collapse results on. Only works on current page of results. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background thread while the current page is being consumed. Defaults to False.
 
         Returns:
             SearchIterator: Search iterator.
@@ -556,6 +995,7 @@ class Client(BaseClient):
             search_after=search_after,
             datasource=datasource,
             collapse=collapse,
+            prefetch=prefetch,
         )
 
     def scan(
@@ -587,18 +1027,20 @@ class Client(BaseClient):
             https://urlscan.io/docs/api/#scan
 
         """
-        data = _compact(
-            {
-                "url": url,
-                "tags": tags,
-                "visibility": visibility,
-                "customagent": customagent,
-                "referer": referer,
-                "overrideSafety": override_safety,
-                "country": country,
-            }
-        )
-        res = self._post("/api/v1/scan/", json=data)
+        data = {
+            k: v
+            for k, v in (
+                ("url", url),
+                ("tags", tags),
+                ("visibility", visibility),
+                ("customagent", customagent),
+                ("referer", referer),
+                ("overrideSafety", override_safety),
+                ("country", country),
+            )
+            if v is not None
+        }
+        res = self._post("/api/v1/scan/", json=data, action=visibility)
         json_res = self._response_to_json(res)
 
         json_visibility = json_res.get("visibility")
@@ -608,7 +1050,7 @@ class Client(BaseClient):
         # memoize the scan UUID & timestamp
         uuid = json_res.get("uuid")
         if isinstance(uuid, str):
-            self._scan_uuid_timestamp_memo[uuid] = time.time()
+            self._memoize_scan_uuid(uuid)
 
         return json_res
 
@@ -622,6 +1064,7 @@ class Client(BaseClient):
         referer: str | None = None,
         override_safety: Any = None,
         country: str | None = None,
+        max_workers: int = 4,
     ) -> list[tuple[str, dict | Exception]]:
         """Scan multiple URLs in bulk.
 
@@ -633,6 +1076,7 @@ class Client(BaseClient):
             referer (str | None, optional): Referer. Defaults to None.
             override_safety (Any, optional): If set to any value, this will disable reclassification of URLs with potential PII in them. Defaults to None.
             country (str | None, optional): Specify which country the scan should be performed from (2-Letter ISO-3166-1 alpha-2 country. Defaults to None.
+            max_workers (int, optional): Maximum number of scans submitted concurrently. Defaults to 4.
 
         Returns:
             list[tuple[str, dict | Exception]]: A list of tuples of (url, scan response or error).
@@ -656,7 +1100,8 @@ class Client(BaseClient):
             except Exception as e:
                 return e
 
-        return [(url, inner(url)) for url in urls]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(zip(urls, executor.map(inner, urls), strict=True))
 
     def wait_for_result(
         self,
@@ -664,36 +1109,146 @@ class Client(BaseClient):
         timeout: float = 60.0,
         interval: float = 1.0,
         initial_wait: float | None = 10.0,
+        max_interval: float = 8.0,
     ) -> None:
         """Wait for a scan result to be available.
 
+        The polling interval grows exponentially (with jitter) from interval up to max_interval.
+
         Args:
             uuid (str): UUID of a result.
             timeout (float, optional): Timeout in seconds. Defaults to 60.0.
-            interval (float, optional): Interval in seconds. Defaults to 1.0.
+            interval (float, optional): Initial interval in seconds. Defaults to 1.0.
             initial_wait (float | None, optional): Initial wait time in seconds. Set None to disable. Defaults to 10.0.
+            max_interval (float, optional): Maximum interval in seconds. Defaults to 8.0.
 
         """
-        session = self._get_session()
+        session = self._session
         req = session.build_request("HEAD", f"/api/v1/result/{uuid}/")
 
-        scanned_at = self._scan_uuid_timestamp_memo.get(uuid)
+        scanned_at = self._get_scan_timestamp(uuid)
         if scanned_at and initial_wait:
             elapsed = time.time() - scanned_at
             if elapsed < initial_wait:
                 time.sleep(initial_wait - elapsed)
 
         start_time = time.time()
+        attempts = 0
         while True:
             res = self._send_request(session, req)
             if res.status_code == 200:
-                self._scan_uuid_timestamp_memo.pop(uuid, None)
+                self._forget_scan_uuid(uuid)
                 return
 
             if time.time() - start_time > timeout:
                 raise TimeoutError("Timeout waiting for scan result.")
 
-            time.sleep(interval)
+            time.sleep(_backoff(interval, max_interval, attempts))
+            attempts += 1
+
+    def wait_for_results(
+        self,
+        uuids: list[str],
+        timeout: float = 60.0,
+        interval: float = 1.0,
+        initial_wait: float | None = 10.0,
+        max_interval: float = 8.0,
+        max_workers: int = 1,
+    ) -> None:
+        """Wait for multiple scan results to be available.
+
+        Pending UUIDs are checked in a single polling loop that sleeps once per round instead of once per UUID.
+        The polling interval grows exponentially (with jitter) from interval up to max_interval.
+
+        Args:
+            uuids (list[str]): UUIDs of results.
+            timeout (float, optional): Timeout in seconds (excluding initial wait). Defaults to 60.0.
+            interval (float, optional): Initial interval in seconds. Defaults to 1.0.
+            initial_wait (float | None, optional): Initial wait time in seconds. Set None to disable. Defaults to 10.0.
+            max_interval (float, optional): Maximum interval in seconds. Defaults to 8.0.
+            max_workers (int, optional): Maximum number of results checked concurrently in each round. Defaults to 1.
+
+        """
+        errors = self._wait_for_results(
+            uuids,
+            timeout=timeout,
+            interval=interval,
+            initial_wait=initial_wait,
+            max_interval=max_interval,
+            max_workers=max_workers,
+        )
+        for error in errors.values():
+            raise error
+
+    def _is_result_ready(self, uuid: str) -> bool:
+        session = self._session
+        req = session.build_request("HEAD", f"/api/v1/result/{uuid}/")
+        res = self._send_request(session, req)
+        return res.status_code == 200
+
+    def _poll_result(self, uuid: str) -> bool | Exception:
+        # return an error instead of raising it so one UUID doesn't fail the others
+        try:
+            return self._is_result_ready(uuid)
+        except Exception as e:
+            return e
+
+    def _wait_for_results(
+        self,
+        uuids: list[str],
+        *,
+        timeout: float,
+        interval: float,
+        initial_wait: float | None,
+        max_interval: float,
+        max_workers: int,
+    ) -> dict[str, Exception]:
+        """Poll scan results until all of them are available or the timeout is reached.
+
+        Returns:
+            dict[str, Exception]: Errors by UUID of results failed to poll or not available by the timeout (TimeoutError).
+
+        """
+        pending: dict[str, None] = dict.fromkeys(uuids)
+        errors: dict[str, Exception] = {}
+
+        deadline = time.time() + (initial_wait or 0.0) + timeout
+        attempts = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                now = time.time()
+                targets: list[str] = []
+                for uuid in pending:
+                    scanned_at = self._get_scan_timestamp(uuid)
+                    # skip UUIDs still in their initial wait
+                    if scanned_at and initial_wait and now - scanned_at < initial_wait:
+                        continue
+
+                    targets.append(uuid)
+
+                for uuid, ready in zip(
+                    targets, executor.map(self._poll_result, targets), strict=True
+                ):
+                    if isinstance(ready, Exception):
+                        errors[uuid] = ready
+                    elif not ready:
+                        continue
+
+                    self._forget_scan_uuid(uuid)
+                    del pending[uuid]
+
+                if not pending:
+                    return errors
+
+                if time.time() > deadline:
+                    errors.update(
+                        (uuid, TimeoutError("Timeout waiting for scan result."))
+                        for uuid in pending
+                    )
+                    return errors
+
+                time.sleep(_backoff(interval, max_interval, attempts))
+                attempts += 1
 
     def scan_and_get_result(
         self,
@@ -756,9 +1311,13 @@ class Client(BaseClient):
         timeout: float = 60.0,
         interval: float = 1.0,
         initial_wait: float | None = 10.0,
+        max_workers: int = 4,
+        max_interval: float = 8.0,
     ) -> list[tuple[str, dict | Exception]]:
         """Scan URLs, wait for results and get them.
 
+        URLs are scanned concurrently, and then their results are polled in a single loop.
+
         Args:
             urls (list[str]): URLs to scan.
             visibility (VisibilityType): Visibility of the scan. Can be "public", "private", or "unlisted".
@@ -770,15 +1329,19 @@ class Client(BaseClient):
             timeout (float, optional): Timeout for waiting a result in seconds. Defaults to 60.0.
             interval (float, optional): Interval in seconds. Defaults to 1.0.
             initial_wait (float | None, optional): Initial wait time in seconds. Set None to disable. Defaults to 10.0.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 4.
+            max_interval (float, optional): Maximum interval in seconds. Defaults to 8.0.
 
         Returns:
-            list[tuple[str, dict | Exception]]: A list of tuples of (url, result or error).
+            list[tuple[str, dict | Exception]]: A list of tuples of (url, result or error). TimeoutError is set as an error if a result is not available by the timeout.
 
         Reference:
             https://urlscan.io/docs/api/#scan
 
         """
-        responses = self.bulk_scan(
+        # scan all the URLs, wait for all the results in a single polling loop & get them
+        # (so the total time is bounded by the slowest scan rather than the sum of them)
+        scanned = self.bulk_scan(
             urls,
             visibility=visibility,
             tags=tags,
@@ -786,19 +1349,34 @@ class Client(BaseClient):
             referer=referer,
             override_safety=override_safety,
             country=country,
+            max_workers=max_workers,
+        )
+        errors = self._wait_for_results(
+            [res["uuid"] for _, res in scanned if isinstance(res, dict)],
+            timeout=timeout,
+            interval=interval,
+            initial_wait=initial_wait,
+            max_interval=max_interval,
+            max_workers=max_workers,
         )
 
-        def mapping(res_or_error: dict | Exception) -> dict | Exception:
-            if isinstance(res_or_error, Exception):
-                return res_or_error
+        def inner(res: dict | Exception) -> dict | Exception:
+            if isinstance(res, Exception):
+                return res
 
-            uuid: str = res_or_error["uuid"]
-            self.wait_for_result(
-                uuid, timeout=timeout, interval=interval, initial_wait=initial_wait
-            )
-            return self.get_result(uuid)
+            uuid: str = res["uuid"]
+            error = errors.get(uuid)
+            if error is not None:
+                return error
+
+            try:
+                return self.get_result(uuid)
+            except Exception as e:
+                return e
 
-        return [(url, mapping(res_or_error)) for url, res_or_error in responses]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(inner, [res for _, res in scanned])
+            return list(zip(urls, results, strict=True))
 
     def get_available_countries(self) -> dict:
         """Retrieve countries available for scanning using the Scan API.
@@ -1,11 +1,16 @@
 """Iterator classes for paginated API responses."""
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from .types import SearchDataSource
 from .utils import _compact
 
 if TYPE_CHECKING:
+    from .async_client import AsyncClient
     from .client import BaseClient
 
 MAX_TOTAL = 10_000
@@ -23,7 +28,105 @@ class BaseIterator:
         raise NotImplementedError()
 
 
-class SearchIterator(BaseIterator):
+class _BaseSearchIterator:
+    """Pagination state & logic shared by the sync and async search iterators."""
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        q: str | None = None,
+        search_after: str | None = None,
+        size: int = 100,
+        limit: int | None = None,
+        datasource: SearchDataSource | None = None,
+        collapse: str | None = None,
+    ):
+        """Initialize the pagination state.
+
+        Args:
+            path (str): API path for the search endpoint.
+            q (str | None, optional): Search query. Defaults to None.
+            search_after (str | None, optional): Search after to retrieve next results. Defaults to None.
+            size (int, optional): Number of results returned in a search. Defaults to 100.
+            limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
+            datasource (SearchDataSource | None, optional): Datasources to search: scans (urlscan.io), hostnames, incidents, notifications, certificates (urlscan Pro). Defaults to None.
+            collapse (str | None, optional): Field to collapse results on. Only works on current page of results. Defaults to None.
+
+        """
+        self._path = path
+        self._size = size
+        self._search_after = search_after
+        self._initial_search_after = search_after
+        # only search_after changes between pages
+        self._base_params = _compact(
+            {"q": q, "size": size, "datasource": datasource, "collapse": collapse}
+        )
+
+        self._results: deque[dict] = deque()
+        self._limit = limit
+        self._count = 0
+        self._total: int | None = None
+        self._has_more: bool = True
+        self._last_result: dict | None = None
+
+    @property
+    def search_after(self) -> str | None:
+        """Return the search after (cursor) of the last returned result.
+
+        Pass it as `search_after` of a new search to resume the iteration after that result.
+
+        Returns:
+            str | None: Search after.
+
+        """
+        if self._last_result is None:
+            return self._initial_search_after
+
+        sort: list[str | int] = self._last_result["sort"]
+        return ",".join(map(str, sort))
+
+    def _parse_response(self, data: dict) -> tuple[list[dict], int]:
+        results: list[dict] = data["results"]
+        total: int = data["total"]
+        return results, total
+
+    def _params(self) -> dict:
+        if self._search_after is None:
+            return self._base_params
+
+        return {**self._base_params, "search_after": self._search_after}
+
+    def _set_page(self, results: list[dict], total: int) -> None:
+        # deque for O(1) popleft (list.pop(0) makes iterating a page quadratic)
+        self._results = deque(results)
+
+        # NOTE: total should be set only once (to ignore newly added results after the first request)
+        self._total = self._total or total
+        if self._total != MAX_TOTAL:
+            self._has_more = self._total > (self._count + len(self._results))
+        else:
+            self._has_more = len(self._results) >= self._size
+
+        # encode the cursor for the next page once per page (before any result is consumed)
+        if results:
+            sort: list[str | int] = results[-1]["sort"]
+            self._search_after = ",".join(map(str, sort))
+
+    def _take_page(self) -> list[dict]:
+        page = list(self._results)
+        self._results.clear()
+        if self._limit is not None:
+            page = page[: self._limit - self._count]
+
+        if page:
+            self._count += len(page)
+            self._last_result = page[-1]
+
+        return page
+
+
+class SearchIterator(_BaseSearchIterator, BaseIterator):
     """Search iterator.
 
     Examples:
@@ -45,6 +148,7 @@ class SearchIterator(BaseIterator):
         limit: int | None = None,
         datasource: SearchDataSource | None = None,
         collapse: str | None = None,
+        prefetch: bool = False,
     ):
         """Initialize the search iterator.
 
@@ -57,69 +161,240 @@ class SearchIterator(BaseIterator):
             limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
             datasource (SearchDataSource | None, optional): Datasources to search: scans (urlscan.io), hostnames, incidents, notifications, certificates (urlscan Pro). Defaults to None.
             collapse (str | None, optional): Field to collapse results on. Only works on current page of results. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background thread while the current page is being consumed. Defaults to False.
 
         """
+        super().__init__(
+            path=path,
+            q=q,
+            search_after=search_after,
+            size=size,
+            limit=limit,
+            datasource=datasource,
+            collapse=collapse,
+        )
         self._client = client
-        self._path = path
-        self._size = size
-        self._q = q
-        self._search_after = search_after
-        self._datasource = datasource
-        self._collapse = collapse
 
-        self._results: list[dict] = []
-        self._limit = limit
-        self._count = 0
-        self._total: int | None = None
-        self._has_more: bool = True
-
-    def _parse_response(self, data: dict) -> tuple[list[dict], int]:
-        results: list[dict] = data["results"]
-        total: int = data["total"]
-        return results, total
+        self._prefetch = prefetch
+        self._executor: ThreadPoolExecutor | None = None
+        self._next_page: Future[tuple[list[dict], int]] | None = None
 
     def _get(self):
-        data = self._client.get_json(
-            self._path,
-            params=_compact(
-                {
-                    "q": self._q,
-                    "size": self._size,
-                    "search_after": self._search_after,
-                    "datasource": self._datasource,
-                    "collapse": self._collapse,
-                }
-            ),
-        )
+        data = self._client.get_json(self._path, params=self._params())
         return self._parse_response(data)
 
+    def _fetch(self) -> tuple[list[dict], int]:
+        if self._next_page is None:
+            return self._get()
+
+        next_page, self._next_page = self._next_page, None
+        return next_page.result()
+
+    def _prefetch_next_page(self):
+        if self._limit is not None and self._count + len(self._results) >= self._limit:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self._next_page = self._executor.submit(self._get)
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def __iter__(self):
         """Return the iterator object."""
         return self
 
+    def iter_pages(self) -> Iterator[list[dict]]:
+        """Iterate over search results page by page.
+
+        This avoids per-result overhead when processing results in bulk (e.g. exporting them to a file).
+        The limit is respected and the search_after property is updated per page.
+
+        Examples:
+            >>> from urlscan import Client
+            >>> with Client("<your_api_key>") as client:
+            ...     for page in client.search("page.domain:example.com").iter_pages():
+            ...         print(len(page))
+
+        Yields:
+            list[dict]: Search results of a page.
+
+        """
+        try:
+            while self._limit is None or self._count < self._limit:
+                if not self._results and (self._count == 0 or self._has_more):
+                    self._set_page(*self._fetch())
+
+                    if self._prefetch and self._has_more:
+                        self._prefetch_next_page()
+
+                page = self._take_page()
+                if not page:
+                    break
+
+                yield page
+        finally:
+            self._shutdown()
+
     def __next__(self):
         """Return the next search result."""
-        if self._limit and self._count >= self._limit:
+        # this runs per result, so keep attribute lookups to a minimum
+        limit, count, results = self._limit, self._count, self._results
+        if limit is not None and count >= limit:
+            self._shutdown()
             raise StopIteration()
 
-        if not self._results and (self._count == 0 or self._has_more):
-            self._results, total = self._get()
-
-            # NOTE: total should be set only once (to ignore newly added results after the first request)
-            self._total = self._total or total
-            if self._total != MAX_TOTAL:
-                self._has_more = self._total > (self._count + len(self._results))
-            else:
-                self._has_more = len(self._results) >= self._size
+        if not results and (count == 0 or self._has_more):
+            self._set_page(*self._fetch())
+            results = self._results
 
-            if len(self._results) > 0:
-                last_result = self._results[-1]
-                sort: list[str | int] = last_result["sort"]
-                self._search_after = ",".join(str(x) for x in sort)
+            if self._prefetch and self._has_more:
+                self._prefetch_next_page()
 
-        if not self._results:
+        if not results:
+            self._shutdown()
             raise StopIteration()
 
-        result = self._results.pop(0)
-        self._count += 1
+        result = results.popleft()
+        self._count = count + 1
+        self._last_result = result
+        return result
+
+
+class AsyncSearchIterator(_BaseSearchIterator):
+    """Async search iterator.
+
+    Examples:
+        >>> from urlscan import AsyncClient
+        >>> async with AsyncClient("<your_api_key>") as client:
+        ...     async for result in client.search("page.domain:example.com"):
+        ...         print(result["_id"], result["page"]["url"])
+
+    """
+
+    def __init__(
+        self,
+        client: "AsyncClient",
+        *,
+        path: str,
+        q: str | None = None,
+        search_after: str | None = None,
+        size: int = 100,
+        limit: int | None = None,
+        datasource: SearchDataSource | None = None,
+        collapse: str | None = None,
+        prefetch: bool = False,
+    ):
+        """Initialize the async search iterator.
+
+        Args:
+            client (AsyncClient): Async client.
+            path (str): API path for the search endpoint.
+            q (str | None, optional): Search query. Defaults to None.
+            search_after (str | None, optional): Search after to retrieve next results. Defaults to None.
+            size (int, optional): Number of results returned in a search. Defaults to 100.
+            limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
+            datasource (SearchDataSource | None, optional): Datasources to search: scans (urlscan.io), hostnames, incidents, notifications, certificates (urlscan Pro). Defaults to None.
+            collapse (str | None, optional): Field to collapse results on. Only works on current page of results. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background task while the current page is being consumed. Defaults to False.
+
+        """
+        super().__init__(
+            path=path,
+            q=q,
+            search_after=search_after,
+            size=size,
+            limit=limit,
+            datasource=datasource,
+            collapse=collapse,
+        )
+        self._client = client
+
+        self._prefetch = prefetch
+        self._next_page: asyncio.Task[tuple[list[dict], int]] | None = None
+
+    async def _get(self) -> tuple[list[dict], int]:
+        data = await self._client.get_json(self._path, params=self._params())
+        return self._parse_response(data)
+
+    async def _fetch(self) -> tuple[list[dict], int]:
+        if self._next_page is None:
+            return await self._get()
+
+        next_page, self._next_page = self._next_page, None
+        return await next_page
+
+    def _prefetch_next_page(self):
+        if self._limit is not None and self._count + len(self._results) >= self._limit:
+            return
+
+        self._next_page = asyncio.create_task(self._get())
+
+    def _cancel(self):
+        if self._next_page is not None:
+            self._next_page.cancel()
+            self._next_page = None
+
+    async def iter_pages(self) -> AsyncIterator[list[dict]]:
+        """Iterate over search results page by page.
+
+        This avoids per-result overhead when processing results in bulk (e.g. exporting them to a file).
+        The limit is respected and the search_after property is updated per page.
+
+        Examples:
+            >>> from urlscan import AsyncClient
+            >>> async with AsyncClient("<your_api_key>") as client:
+            ...     async for page in client.search("page.domain:example.com").iter_pages():
+            ...         print(len(page))
+
+        Yields:
+            list[dict]: Search results of a page.
+
+        """
+        try:
+            while self._limit is None or self._count < self._limit:
+                if not self._results and (self._count == 0 or self._has_more):
+                    self._set_page(*await self._fetch())
+
+                    if self._prefetch and self._has_more:
+                        self._prefetch_next_page()
+
+                page = self._take_page()
+                if not page:
+                    break
+
+                yield page
+        finally:
+            self._cancel()
+
+    def __aiter__(self):
+        """Return the async iterator object."""
+        return self
+
+    async def __anext__(self):
+        """Return the next search result."""
+        # this runs per result, so keep attribute lookups to a minimum
+        limit, count, results = self._limit, self._count, self._results
+        if limit is not None and count >= limit:
+            self._cancel()
+            raise StopAsyncIteration()
+
+        if not results and (count == 0 or self._has_more):
+            self._set_page(*await self._fetch())
+            results = self._results
+
+            if self._prefetch and self._has_more:
+                self._prefetch_next_page()
+
+        if not results:
+            self._cancel()
+            raise StopAsyncIteration()
+
+        result = results.popleft()
+        self._count = count + 1
+        self._last_result = result
         return result
@@ -1,179 +1,174 @@
 """urlscan.io Pro API client module."""
 
-from functools import cached_property
-from typing import BinaryIO
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib.parse import quote_plus
 
-from urlscan.client import BaseClient
+from urlscan.client import BaseClient, _SharedTransport
 from urlscan.iterator import SearchIterator
-from urlscan.pro.visibility import Visibility
 from urlscan.types import MaliciousObservableType
-from urlscan.utils import _compact
-
-from .brand import Brand
-from .channel import Channel
-from .datadump import DataDump
-from .hostname import HostnameIterator
-from .incident import Incident
-from .livescan import LiveScan
-from .saved_search import SavedSearch
-from .subscription import Subscription
+from urlscan.utils import _cached_property, _compact
+
+if TYPE_CHECKING:
+    from .brand import Brand
+    from .channel import Channel
+    from .datadump import DataDump
+    from .hostname import HostnameIterator
+    from .incident import Incident
+    from .livescan import LiveScan
+    from .saved_search import SavedSearch
+    from .subscription import Subscription
+    from .visibility import Visibility
+
+# sub-client modules are imported on first access (PEP 562)
+# so only the sub-clients actually used are loaded
+_LAZY_IMPORTS = {
+    "Brand": ".brand",
+    "Channel": ".channel",
+    "DataDump": ".datadump",
+    "HostnameIterator": ".hostname",
+    "Incident": ".incident",
+    "LiveScan": ".livescan",
+    "SavedSearch": ".saved_search",
+    "Subscription": ".subscription",
+    "Visibility": ".visibility",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # cache it in the module namespace so __getattr__ is not called again
+    globals()[name] = value
+    return value
 
 
 class Pro(BaseClient):
     """urlscan.io Pro API client."""
 
-    @cached_property
-    def brand(self) -> Brand:
+    @_cached_property
+    def _client_kwargs(self) -> dict[str, Any]:
+        # keyword arguments to create sub-clients with the same configuration as this client
+        return {
+            "api_key": self._api_key,
+            "base_url": self._base_url,
+            "user_agent": self._user_agent,
+            "trust_env": self._trust_env,
+            "timeout": self._timeout,
+            "proxy": self._proxy,
+            "verify": self._verify,
+            "retry": self._retry,
+            "follow_redirects": self._follow_redirects,
+            "limits": self._limits,
+            "http2": self._http2,
+            "etag_cache_size": self._etag_cache_size,
+            # sub-clients share the connection pool of this client (it's closed along with this client)
+            "transport": (
+                _SharedTransport(self._session_transport)
+                if self._session_transport is not None
+                else None
+            ),
+        }
+
+    @_cached_property
+    def brand(self) -> "Brand":
         """Brand API client instance.
 
         Returns:
             Brand: Brand API client instance.
 
         """
-        return Brand(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .brand import Brand
+
+        return Brand(**self._client_kwargs)
 
-    @cached_property
-    def channel(self) -> Channel:
+    @_cached_property
+    def channel(self) -> "Channel":
         """Channel API client instance.
 
         Returns:
             Channel: Channel API client instance.
 
         """
-        return Channel(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .channel import Channel
+
+        return Channel(**self._client_kwargs)
 
-    @cached_property
-    def datadump(self) -> DataDump:
+    @_cached_property
+    def datadump(self) -> "DataDump":
         """Data dump API client instance.
 
         Returns:
             DataDump: Data dump API client instance.
 
         """
-        return DataDump(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .datadump import DataDump
+
+        return DataDump(**self._client_kwargs)
 
-    @cached_property
-    def incident(self) -> Incident:
+    @_cached_property
+    def incident(self) -> "Incident":
         """Incident API client instance.
 
         Returns:
             Incident: Incident API client instance.
 
         """
-        return Incident(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .incident import Incident
 
-    @cached_property
-    def livescan(self) -> LiveScan:
+        return Incident(**self._client_kwargs)
+
+    @_cached_property
+    def livescan(self) -> "LiveScan":
         """Live scan API client instance.
 
         Returns:
             LiveScan: Live scan API client instance.
 
         """
-        return LiveScan(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .livescan import LiveScan
 
-    @cached_property
-    def saved_search(self) -> SavedSearch:
+        return LiveScan(**self._client_kwargs)
+
+    @_cached_property
+    def saved_search(self) -> "SavedSearch":
         """Saved Search API client instance.
 
         Returns:
             SavedSearch: Saved Search API client instance.
 
         """
-        return SavedSearch(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .saved_search import SavedSearch
+
+        return SavedSearch(**self._client_kwargs)
 
-    @cached_property
-    def subscription(self) -> Subscription:
+    @_cached_property
+    def subscription(self) -> "Subscription":
         """Subscription API client instance.
 
         Returns:
             Subscription: Subscription API client instance.
 
         """
-        return Subscription(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .subscription import Subscription
+
+        return Subscription(**self._client_kwargs)
 
-    @cached_property
-    def visibility(self) -> Visibility:
+    @_cached_property
+    def visibility(self) -> "Visibility":
         """Visibility API client instance.
 
         Returns:
             Visibility: Visibility API client instance.
 
         """
-        return Visibility(
-            api_key=self._api_key,
-            base_url=self._base_url,
-            user_agent=self._user_agent,
-            trust_env=self._trust_env,
-            timeout=self._timeout,
-            proxy=self._proxy,
-            verify=self._verify,
-            retry=self._retry,
-        )
+        from .visibility import Visibility
+
+        return Visibility(**self._client_kwargs)
 
     def structure_search(
         self,
@@ -210,7 +205,8 @@ class Pro(BaseClient):
         size: int = 1000,
         limit: int | None = None,
         page_state: str | None = None,
-    ) -> HostnameIterator:
+        prefetch: bool = False,
+    ) -> "HostnameIterator":
         """Get the historical observations for a specific hostname.
 
         Args:
@@ -218,19 +214,68 @@ class Pro(BaseClient):
             page_state (str | None, optional): Page state for pagination. Defaults to None.
             size (int, optional): Number of results returned in a search. Defaults to 1000.
             limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background thread while the current page is being consumed. Defaults to False.
 
         Returns:
             HostnameIterator: Hostname iterator.
 
         """
+        from .hostname import HostnameIterator
+
         return HostnameIterator(
             client=self,
             hostname=hostname,
             size=size,
             limit=limit,
             page_state=page_state,
+            prefetch=prefetch,
         )
 
+    def bulk_hostname(
+        self,
+        hostnames: list[str],
+        *,
+        size: int = 1000,
+        limit: int | None = None,
+        max_workers: int = 4,
+    ) -> list[tuple[str, "HostnameIterator | Exception"]]:
+        """Get the historical observations for multiple hostnames concurrently.
+
+        The first page of each hostname is fetched concurrently over the shared connection pool.
+        The following pages are fetched lazily while iterating.
+
+        Examples:
+            >>> from urlscan import Pro
+            >>> with Pro("<your_api_key>") as client:
+            ...     for hostname, it in client.bulk_hostname(["example.com", "example.org"]):
+            ...         if isinstance(it, Exception):
+            ...             continue
+            ...         for result in it:
+            ...             print(hostname, result["sub_id"])
+
+        Args:
+            hostnames (list[str]): List of hostnames to query.
+            size (int, optional): Number of results returned in a search. Defaults to 1000.
+            limit (int | None, optional): Maximum number of results that will be returned by each iterator. Defaults to None.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            list[tuple[str, HostnameIterator | Exception]]: A list of tuples of (hostname, hostname iterator or error).
+
+        """
+
+        def inner(hostname: str) -> "HostnameIterator | Exception":
+            try:
+                it = self.hostname(hostname, size=size, limit=limit)
+                it._load_page()
+            except Exception as e:
+                return e
+
+            return it
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(zip(hostnames, executor.map(inner, hostnames), strict=True))
+
     def download_file(
         self,
         file_hash: str,
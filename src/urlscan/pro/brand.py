@@ -2,6 +2,10 @@
 
 from urlscan.client import BaseClient
 
+# the brand catalog rarely changes, so responses are reused for a while
+AVAILABLE_BRANDS_CACHE_TTL = 300.0
+BRANDS_CACHE_TTL = 900.0
+
 
 class Brand(BaseClient):
     """Brand API client."""
@@ -9,6 +13,8 @@ class Brand(BaseClient):
     def get_available_brands(self) -> dict:
         """Get a list of brands that are tracked as part of urlscan's brand detection.
 
+        The response is cached for 5 minutes. Use clear_cache to refresh it.
+
         Returns:
             dict: Response containing a list of brand objects.
 
@@ -16,12 +22,14 @@ class Brand(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/brands/availablebrands
 
         """
-        return self.get_json("/api/v1/pro/availableBrands")
+        return self._get_cached_json(
+            "/api/v1/pro/availableBrands", AVAILABLE_BRANDS_CACHE_TTL
+        )
 
     def get_brands(self) -> dict:
         """Get a list of brands that we are able to detect phishing pages with the total number of detected pages and the latest hit for each brand.
 
-        This is slower than the get_available method.
+        This is slower than the get_available method. The response is cached for 15 minutes. Use clear_cache to refresh it.
 
         Returns:
             dict: Response containing a list of brand object with detection statistics.
@@ -30,4 +38,4 @@ class Brand(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/brands/brandsummary
 
         """
-        return self.get_json("/api/v1/pro/brands")
+        return self._get_cached_json("/api/v1/pro/brands", BRANDS_CACHE_TTL)
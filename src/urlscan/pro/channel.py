@@ -12,6 +12,42 @@ from urlscan.types import (
 from urlscan.utils import _compact, _merge
 
 
+def _channel_payload(
+    *,
+    channel_type: ChannelTypeType,
+    name: str,
+    webhook_url: str | None,
+    frequency: FrequencyType | None,
+    email_addresses: list[str] | None,
+    utc_time: str | None,
+    is_active: bool | None,
+    is_default: bool | None,
+    ignore_time: bool | None,
+    week_days: list[WeekDaysType] | None,
+    permissions: list[ChannelPermissionType] | None,
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a channel payload shared by create and update."""
+    return _compact(
+        _merge(
+            {
+                "type": channel_type,
+                "name": name,
+                "webhookURL": webhook_url,
+                "frequency": frequency,
+                "emailAddresses": email_addresses,
+                "utcTime": utc_time,
+                "isActive": is_active,
+                "isDefault": is_default,
+                "ignoreTime": ignore_time,
+                "weekDays": week_days,
+                "permissions": permissions,
+            },
+            kwargs,
+        )
+    )
+
+
 class Channel(BaseClient):
     """Client API client."""
 
@@ -66,25 +102,22 @@ class Channel(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/channels/channelscreate
 
         """
-        channel: dict[str, Any] = _compact(
-            _merge(
-                {
-                    "type": channel_type,
-                    "name": name,
-                    "webhookURL": webhook_url,
-                    "frequency": frequency,
-                    "emailAddresses": email_addresses,
-                    "utcTime": utc_time,
-                    "isActive": is_active,
-                    "isDefault": is_default,
-                    "ignoreTime": ignore_time,
-                    "weekDays": week_days,
-                    "permissions": permissions,
-                },
-                kwargs,
+        data = {
+            "channel": _channel_payload(
+                channel_type=channel_type,
+                name=name,
+                webhook_url=webhook_url,
+                frequency=frequency,
+                email_addresses=email_addresses,
+                utc_time=utc_time,
+                is_active=is_active,
+                is_default=is_default,
+                ignore_time=ignore_time,
+                week_days=week_days,
+                permissions=permissions,
+                kwargs=kwargs,
             )
-        )
-        data = {"channel": channel}
+        }
 
         res = self._post("/api/v1/user/channels/", json=data)
         return self._response_to_json(res)
@@ -145,25 +178,22 @@ class Channel(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/channels/channelsupdate
 
         """
-        channel: dict[str, Any] = _compact(
-            _merge(
-                {
-                    "type": channel_type,
-                    "name": name,
-                    "webhookURL": webhook_url,
-                    "frequency": frequency,
-                    "emailAddresses": email_addresses,
-                    "utcTime": utc_time,
-                    "isActive": is_active,
-                    "isDefault": is_default,
-                    "ignoreTime": ignore_time,
-                    "weekDays": week_days,
-                    "permissions": permissions,
-                },
-                kwargs,
+        data = {
+            "channel": _channel_payload(
+                channel_type=channel_type,
+                name=name,
+                webhook_url=webhook_url,
+                frequency=frequency,
+                email_addresses=email_addresses,
+                utc_time=utc_time,
+                is_active=is_active,
+                is_default=is_default,
+                ignore_time=ignore_time,
+                week_days=week_days,
+                permissions=permissions,
+                kwargs=kwargs,
             )
-        )
-        data = {"channel": channel}
+        }
 
         res = self._put(f"/api/v1/user/channels/{channel_id}/", json=data)
         return self._response_to_json(res)
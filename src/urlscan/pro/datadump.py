@@ -1,10 +1,12 @@
 """Data dump API client module."""
 
 from typing import BinaryIO
-from urllib.parse import urljoin
 
 from urlscan.client import BaseClient
 
+# data dump files are often several GBs, so write them in larger chunks
+DATADUMP_CHUNK_SIZE = 1024 * 1024
+
 
 class DataDump(BaseClient):
     """Data dump API client."""
@@ -27,21 +29,26 @@ class DataDump(BaseClient):
             ...     result = client.datadump.get_list("days/api/20260101")
 
         """
-        return self.get_json(urljoin("/api/v1/datadump/list/", path))
+        return self.get_json(f"/api/v1/datadump/list/{path.lstrip('/')}")
 
     def download_file(
         self,
         path: str,
         file: BinaryIO,
+        chunk_size: int = DATADUMP_CHUNK_SIZE,
     ):
         """Download the datadump file.
 
+        The file is streamed to the file object chunk by chunk, so it's never held in memory as a whole.
+
         Args:
             path (str): Path to API endpoint.
             file (BinaryIO): File object to write to.
+            chunk_size (int, optional): Size of chunks in bytes to write. Defaults to DATADUMP_CHUNK_SIZE (1 MiB).
 
         """
-        return super().download(
-            urljoin("/api/v1/datadump/link/", path),
+        return self.download(
+            f"/api/v1/datadump/link/{path.lstrip('/')}",
             file=file,
+            chunk_size=chunk_size,
         )
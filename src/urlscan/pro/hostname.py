@@ -1,10 +1,14 @@
 """Hostname API client module."""
 
-from urllib.parse import urljoin
+import base64
+import json
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
 
 from urlscan.client import BaseClient
 from urlscan.iterator import BaseIterator
-from urlscan.utils import _compact
 
 
 class HostnameIterator(BaseIterator):
@@ -26,6 +30,7 @@ class HostnameIterator(BaseIterator):
         page_state: str | None = None,
         size: int = 1_000,
         limit: int | None = None,
+        prefetch: bool = False,
     ):
         """Initialize the hostname iterator.
 
@@ -35,47 +40,195 @@ class HostnameIterator(BaseIterator):
             page_state (str | None, optional): Page state for pagination. Defaults to None.
             size (int, optional): Number of results returned in a search. Defaults to 1000.
             limit (int | None, optional): Maximum number of results that will be returned by the iterator. Defaults to None.
+            prefetch (bool, optional): Whether to fetch the next page in a background thread while the current page is being consumed. Defaults to False.
 
         """
+        # fail fast instead of wasting a request on an invalid hostname
+        if not hostname or len(hostname) > 253 or any(c in hostname for c in " \t\n/"):
+            raise ValueError(f"Invalid hostname: {hostname!r}")
+
         self._client = client
-        self._path = urljoin("/api/v1/hostname/", hostname)
-        self._page_state = page_state
+        self._hostname = hostname
+        # quote once (instead of per page)
+        self._path = f"/api/v1/hostname/{quote(hostname, safe='')}"
         self._size = size
-        self._results: list[dict] = []
+        self._page_state = page_state
+        # only pageState changes between pages
+        self._base_params = {"limit": size}
+        self._results: deque[dict] = deque()
         self._limit = limit
         self._count = 0
         self._has_more: bool = True
 
+        # page state & length of the page being consumed (to resume from the middle of it)
+        self._current_page_state = page_state
+        self._current_page_length = 0
+        # number of results to skip in the first page (set when resuming from a state token)
+        self._skip = 0
+
+        self._prefetch = prefetch
+        self._executor: ThreadPoolExecutor | None = None
+        self._next_page: Future[tuple[list[dict], str | None]] | None = None
+
+    @classmethod
+    def from_state_token(
+        cls, client: BaseClient, token: str, *, prefetch: bool = False
+    ) -> "HostnameIterator":
+        """Create a hostname iterator resuming from a state token.
+
+        Examples:
+            >>> from urlscan import Pro
+            >>> from urlscan.pro import HostnameIterator
+            >>> with Pro("<your_api_key>") as client:
+            ...     it = HostnameIterator.from_state_token(client, "<state_token>")
+            ...     for result in it:
+            ...         print(result["sub_id"], result["data"])
+
+        Args:
+            client (Client): Client.
+            token (str): State token returned by state_token.
+            prefetch (bool, optional): Whether to fetch the next page in a background thread while the current page is being consumed. Defaults to False.
+
+        Returns:
+            HostnameIterator: Hostname iterator.
+
+        """
+        state: dict = json.loads(base64.urlsafe_b64decode(token))
+        it = cls(
+            client,
+            hostname=state["hostname"],
+            page_state=state["page_state"],
+            size=state["size"],
+            limit=state["limit"],
+            prefetch=prefetch,
+        )
+        it._count = state["count"]
+        it._skip = state["offset"]
+        return it
+
+    def state_token(self) -> str:
+        """Return an opaque token of the iteration state.
+
+        Persist it to resume the iteration later (e.g. in another process) with from_state_token.
+        The iteration is resumed right after the last returned result.
+
+        Returns:
+            str: State token.
+
+        """
+        page_state = self._current_page_state
+        offset = self._current_page_length - len(self._results)
+        if len(self._results) == 0 and self._has_more:
+            # the current page is consumed (or not loaded yet), so resume from the next page
+            # (keeping the offset of a resumed iteration not loaded yet)
+            page_state, offset = self._page_state, self._skip
+
+        state = {
+            "hostname": self._hostname,
+            "size": self._size,
+            "limit": self._limit,
+            "count": self._count,
+            "page_state": page_state,
+            "offset": offset,
+        }
+        return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
     def _parse_response(self, data: dict) -> tuple[list[dict], str | None]:
         results: list[dict] = data["results"]
         page_state: str | None = data["pageState"]
         return results, page_state
 
+    def _params(self) -> dict:
+        if self._page_state is None:
+            return self._base_params
+
+        return {**self._base_params, "pageState": self._page_state}
+
     def _get(self):
-        data = self._client.get_json(
-            self._path,
-            params=_compact(
-                {
-                    "limit": self._size,
-                    "pageState": self._page_state,
-                }
-            ),
-        )
+        data = self._client.get_json(self._path, params=self._params())
         return self._parse_response(data)
 
+    def _fetch(self) -> tuple[list[dict], str | None]:
+        if self._next_page is None:
+            return self._get()
+
+        next_page, self._next_page = self._next_page, None
+        return next_page.result()
+
+    def _prefetch_next_page(self):
+        if self._limit is not None and self._count + len(self._results) >= self._limit:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self._next_page = self._executor.submit(self._get)
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _load_page(self):
+        self._current_page_state = self._page_state
+        results, page_state = self._fetch()
+        self._current_page_length = len(results)
+        # deque for O(1) popleft (list.pop(0) makes iterating a page quadratic)
+        self._results = deque(results[self._skip :])
+        self._skip = 0
+        self._page_state = page_state
+        self._has_more = page_state is not None
+
+        if self._prefetch and self._has_more:
+            self._prefetch_next_page()
+
+    def iter_pages(self) -> Iterator[list[dict]]:
+        """Iterate over hostname observation results page by page.
+
+        Prefer this over the per-result iteration (or building a list of all the results) for hostnames with many observations.
+        The limit is respected and the state token is updated per page.
+
+        Examples:
+            >>> from urlscan import Pro
+            >>> with Pro("<your_api_key>") as client:
+            ...     for page in client.hostname("example.com").iter_pages():
+            ...         print(len(page))
+
+        Yields:
+            list[dict]: Hostname observation results of a page.
+
+        """
+        try:
+            while self._limit is None or self._count < self._limit:
+                if len(self._results) == 0 and self._has_more:
+                    self._load_page()
+
+                page = list(self._results)
+                self._results.clear()
+                if self._limit is not None:
+                    page = page[: self._limit - self._count]
+
+                if not page:
+                    break
+
+                self._count += len(page)
+                yield page
+        finally:
+            self._shutdown()
+
     def __next__(self):
         """Return the next hostname observation result."""
-        if self._limit and self._count >= self._limit:
+        if self._limit is not None and self._count >= self._limit:
+            self._shutdown()
             raise StopIteration()
 
         if len(self._results) == 0 and self._has_more:
-            self._results, page_state = self._get()
-            self._page_state = page_state
-            self._has_more = page_state is not None
+            self._load_page()
 
         if len(self._results) == 0:
+            self._shutdown()
             raise StopIteration()
 
-        result = self._results.pop(0)
+        result = self._results.popleft()
         self._count += 1
         return result
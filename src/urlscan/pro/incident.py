@@ -1,14 +1,15 @@
 """Incident management API client module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from urlscan.client import BaseClient, _compact
+from urlscan.client import BaseClient
 from urlscan.types import (
     IncidentVisibilityType,
     ScanIntervalModeType,
     WatchedAttributeType,
 )
-from urlscan.utils import _merge
+from urlscan.utils import _compact, _merge
 
 
 class Incident(BaseClient):
@@ -107,7 +108,7 @@ class Incident(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/incidents/getincident
 
         """
-        return super().get_json(f"/api/v1/user/incidents/{incident_id}")
+        return self.get_json(f"/api/v1/user/incidents/{incident_id}")
 
     def update(
         self,
@@ -260,6 +261,8 @@ class Incident(BaseClient):
     def get_watchable_attributes(self) -> dict:
         """Get the list of attributes which can be supplied to the watchedAttributes property of the incident.
 
+        The response is cached for 5 minutes. Use clear_cache to refresh it.
+
         Returns:
             dict: List of watchable attributes.
 
@@ -267,7 +270,7 @@ class Incident(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/incidents/getwatchableattributes
 
         """
-        return self.get_json("/api/v1/user/watchableAttributes")
+        return self._get_cached_json("/api/v1/user/watchableAttributes")
 
     def get_states(self, incident_id: str) -> dict:
         """Retrieve individual incident states of an incident.
@@ -283,3 +286,33 @@ class Incident(BaseClient):
 
         """
         return self.get_json(f"/api/v1/user/incidentstates/{incident_id}/")
+
+    def bulk_get_states(
+        self, incident_ids: list[str], *, max_workers: int = 4
+    ) -> list[tuple[str, dict | Exception]]:
+        """Retrieve incident states of multiple incidents concurrently.
+
+        Requests are sent from a thread pool sharing the client's connection pool.
+
+        Args:
+            incident_ids (list[str]): List of incident IDs.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            list[tuple[str, dict | Exception]]: A list of tuples of (incident ID, incident states or error).
+
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/incidents/getincidentstates
+
+        """
+
+        def inner(incident_id: str) -> dict | Exception:
+            try:
+                return self.get_states(incident_id)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                zip(incident_ids, executor.map(inner, incident_ids), strict=True)
+            )
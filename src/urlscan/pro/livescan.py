@@ -1,10 +1,21 @@
 """Live scanning API client module."""
 
-from typing import Any
+import os
+from collections.abc import Callable
+from typing import Any, BinaryIO
 
-from urlscan.client import BaseClient, _compact
+from urlscan.client import BaseClient
 from urlscan.types import LiveScanResourceType, VisibilityType
-from urlscan.utils import _merge
+from urlscan.utils import _compact, _merge
+
+# resource type -> method to get the resource with
+_RESOURCE_GETTERS: dict[str, Callable[[BaseClient, str], Any]] = {
+    "result": BaseClient.get_json,
+    "screenshot": BaseClient.get_content,
+    "response": BaseClient.get_content,
+    "download": BaseClient.get_content,
+    "dom": BaseClient.get_text,
+}
 
 
 class LiveScan(BaseClient):
@@ -13,6 +24,8 @@ class LiveScan(BaseClient):
     def get_scanners(self) -> dict:
         """Get a list of available Live Scanning nodes along with their current metadata.
 
+        The response is cached for 5 minutes. Use clear_cache to refresh it.
+
         Returns:
             dict: List of available scanners with metadata.
 
@@ -20,7 +33,7 @@ class LiveScan(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/live-scanning/livescanscanners
 
         """
-        return self.get_json("/api/v1/livescan/scanners/")
+        return self._get_cached_json("/api/v1/livescan/scanners/")
 
     def task(
         self,
@@ -158,17 +171,44 @@ class LiveScan(BaseClient):
 
         """
         path = f"/api/v1/livescan/{scanner_id}/{resource_type}/{resource_id}"
+        getter = _RESOURCE_GETTERS.get(resource_type, BaseClient._get)
+        return getter(self, path)
 
-        if resource_type == "result":
-            return self.get_json(path)
+    def download_resource(
+        self,
+        *,
+        scanner_id: str,
+        resource_type: LiveScanResourceType,
+        resource_id: str,
+        file: BinaryIO | str | os.PathLike,
+    ) -> None:
+        """Download the resource for a particular scan ID or SHA256 from this live scanner to a file.
+
+        Unlike get_resource, the resource is streamed to the file without being buffered in memory.
+
+        Examples:
+            >>> from urlscan import Pro
+            >>> with Pro("<your_api_key>") as pro:
+            ...     pro.livescan.download_resource(
+            ...         scanner_id="de01",
+            ...         resource_type="screenshot",
+            ...         resource_id="<uuid>",
+            ...         file="screenshot.png",
+            ...     )
 
-        if resource_type in ("screenshot", "response", "download"):
-            return self.get_content(path)
+        Args:
+            scanner_id (str): Scanner ID (e.g., "de01" for Germany).
+            resource_type (LiveScanResourceType): Type of resource ("result", "screenshot", "dom", "response", or "download").
+            resource_id (str): Resource ID. For result/screenshot/dom: UUID of the scan. For response/download: SHA256 of the resource.
+            file (BinaryIO | str | os.PathLike): File object or file path to write to.
 
-        if resource_type == "dom":
-            return self.get_text(path)
+        Reference:
+            https://docs.urlscan.io/apis/urlscan-openapi/live-scanning/livescangetresource
 
-        return self._get(path)
+        """
+        self.download(
+            f"/api/v1/livescan/{scanner_id}/{resource_type}/{resource_id}", file=file
+        )
 
     def store(
         self,
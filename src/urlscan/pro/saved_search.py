@@ -2,9 +2,9 @@
 
 from typing import Any
 
-from urlscan.client import BaseClient, _compact
+from urlscan.client import BaseClient
 from urlscan.types import PermissionType, SavedSearchDataSource, TLPType
-from urlscan.utils import _merge
+from urlscan.utils import _compact, _merge
 
 
 class SavedSearch(BaseClient):
@@ -161,7 +161,7 @@ class SavedSearch(BaseClient):
             https://docs.urlscan.io/apis/urlscan-openapi/saved-searches/savedsearches-delete
 
         """
-        res = super()._delete(f"/api/v1/user/searches/{search_id}/")
+        res = self._delete(f"/api/v1/user/searches/{search_id}/")
         return self._response_to_json(res)
 
     def get_results(self, search_id: str) -> dict:
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from urlscan.client import BaseClient, _compact
+from urlscan.client import BaseClient
 from urlscan.types import (
     FrequencyType,
     IncidentCreationModeType,
@@ -11,7 +11,7 @@ from urlscan.types import (
     SubscriptionPermissionType,
     WeekDaysType,
 )
-from urlscan.utils import _merge
+from urlscan.utils import _compact, _merge
 
 
 class Subscription(BaseClient):
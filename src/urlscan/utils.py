@@ -1,13 +1,22 @@
 """Utility functions for urlscan.io API client."""
 
 import datetime
+import email.utils
+import functools
 import gzip
+import math
 import os
+import random
 import tarfile
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar, overload
 
 StrOrBytesPath = str | bytes | os.PathLike[str] | os.PathLike[bytes]
 
+_T = TypeVar("_T")
+
 
 def _compact(d: dict) -> dict:
     """Remove empty values from a dictionary."""
@@ -26,12 +35,131 @@ def _merge(d: dict, kwargs: dict[str, Any]) -> dict:
     return result
 
 
+class _cached_property(Generic[_T]):  # noqa: N801
+    """Minimal functools.cached_property without a lock.
+
+    functools.cached_property takes a lock on first access in Python < 3.12.
+    The computed value is stored in the instance __dict__, which shadows this (non-data) descriptor afterwards.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]):
+        """Initialize with a function computing the value."""
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Set the attribute name to store the value."""
+        self.name = name
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> "_cached_property[_T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:
+        """Compute the value and cache it in the instance."""
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class _LRUCache:
+    """Thread-safe LRU cache with a maximum size."""
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of items. Set 0 to disable caching.
+
+        """
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a cached value or None if it's missing."""
+        with self._lock:
+            if key not in self._data:
+                return None
+
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value and evict the least recently used ones if it's full."""
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._data)
+
+
+def _backoff(interval: float, max_interval: float, attempts: int) -> float:
+    """Return a capped exponential backoff delay with jitter.
+
+    The delay is interval * 2^attempts capped by max_interval, randomized down to half of it.
+    """
+    # cap the exponent so that a long polling doesn't overflow the float conversion
+    delay = min(interval * (2 ** min(attempts, 32)), max_interval)
+    return delay * (0.5 + random.random() * 0.5)
+
+
+# rate limit reset headers repeat the same value until the window resets,
+# so memoize parse results (datetime objects are immutable)
+@functools.lru_cache(maxsize=128)
 def _parse_datetime(s: str) -> datetime.datetime:
     """Parse an ISO 8601 datetime string to a datetime object."""
     dt = datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%S.%fZ")
     return dt.replace(tzinfo=datetime.timezone.utc)
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After (or X-Rate-Limit-Reset-After) header value to seconds.
+
+    The value can be either a number of seconds or an HTTP-date. None is returned if it's missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            dt = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+
+        seconds = (dt - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+
+    if not math.isfinite(seconds):
+        return None
+
+    return max(seconds, 0.0)
+
+
 def extract(path: StrOrBytesPath, outdir: StrOrBytesPath):
     """Extract a compressed file to the specified output directory.
 
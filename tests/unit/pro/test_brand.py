@@ -86,3 +86,24 @@ def test_get_brands(pro: Pro, httpserver: HTTPServer):
 
     got = pro.brand.get_brands()
     assert got == data
+
+
+def test_get_available_brands_is_cached(pro: Pro, httpserver: HTTPServer, freezer):
+    data = {"kits": []}
+    httpserver.expect_request(
+        "/api/v1/pro/availableBrands",
+        method="GET",
+    ).respond_with_json(data)
+
+    assert pro.brand.get_available_brands() == data
+    assert pro.brand.get_available_brands() == data
+    assert len(httpserver.log) == 1
+
+    # expired
+    freezer.tick(301)
+    assert pro.brand.get_available_brands() == data
+    assert len(httpserver.log) == 2
+
+    pro.brand.clear_cache()
+    assert pro.brand.get_available_brands() == data
+    assert len(httpserver.log) == 3
@@ -16,6 +16,17 @@ def test_get_list(pro: Pro, httpserver: HTTPServer):
     assert got == data
 
 
+def test_get_list_with_leading_slash(pro: Pro, httpserver: HTTPServer):
+    data: dict[str, Any] = {"files": []}
+    httpserver.expect_request(
+        "/api/v1/datadump/list/days/api/20260101/"
+    ).respond_with_json(data)
+
+    # a leading slash should not replace the API path
+    got = pro.datadump.get_list("/days/api/20260101/")
+    assert got == data
+
+
 def test_download_file(pro: Pro, httpserver: HTTPServer, tmp_path):
     httpserver.expect_request(
         "/api/v1/datadump/link/days/api/20260101/testfile.gz"
@@ -1,6 +1,8 @@
+import pytest
 from pytest_httpserver import HTTPServer
 
-from urlscan import Pro
+from urlscan import APIError, Pro
+from urlscan.pro import HostnameIterator
 
 
 def test_hostname(pro: Pro, httpserver: HTTPServer):
@@ -17,6 +19,12 @@ def test_hostname(pro: Pro, httpserver: HTTPServer):
     assert len(httpserver.log) == 1
 
 
+@pytest.mark.parametrize("hostname", ["", "example .com", "example.com/foo", "a" * 254])
+def test_hostname_with_invalid_hostname(pro: Pro, hostname: str):
+    with pytest.raises(ValueError):
+        pro.hostname(hostname)
+
+
 def test_hostname_with_pagination(pro: Pro, httpserver: HTTPServer):
     hostname = "example.com"
 
@@ -34,14 +42,59 @@ def test_hostname_with_pagination(pro: Pro, httpserver: HTTPServer):
         query_string={"limit": "1", "pageState": "state1"},
     ).respond_with_json({"results": [{"sub_id": "dummy2"}], "pageState": None})
 
-    iterator = pro.hostname(hostname)
-    iterator._size = 1
+    iterator = pro.hostname(hostname, size=1)
 
     got = list(iterator)
     assert len(got) == 2
     assert len(httpserver.log) == 2
 
 
+def test_hostname_with_prefetch(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    httpserver.expect_ordered_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "1000"},
+    ).respond_with_json({"results": [{"sub_id": "dummy1"}], "pageState": "state1"})
+    httpserver.expect_ordered_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "1000", "pageState": "state1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy2"}], "pageState": None})
+
+    got = list(pro.hostname(hostname, prefetch=True))
+    assert [r["sub_id"] for r in got] == ["dummy1", "dummy2"]
+    assert len(httpserver.log) == 2
+
+
+def test_hostname_iter_pages(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "2"},
+    ).respond_with_json(
+        {"results": [{"sub_id": "dummy1"}, {"sub_id": "dummy2"}], "pageState": "state1"}
+    )
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "2", "pageState": "state1"},
+    ).respond_with_json(
+        {"results": [{"sub_id": "dummy3"}, {"sub_id": "dummy4"}], "pageState": None}
+    )
+
+    got = list(pro.hostname(hostname, size=2, limit=3).iter_pages())
+    # the last page should be truncated by the limit
+    assert [[r["sub_id"] for r in page] for page in got] == [
+        ["dummy1", "dummy2"],
+        ["dummy3"],
+    ]
+    assert len(httpserver.log) == 2
+
+
 def test_hostname_with_limit(pro: Pro, httpserver: HTTPServer):
     hostname = "example.com"
 
@@ -61,6 +114,20 @@ def test_hostname_with_limit(pro: Pro, httpserver: HTTPServer):
     assert len(httpserver.log) == 1
 
 
+def test_hostname_with_zero_limit(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    # limit=0 should return nothing (same as the search iterator)
+    it = pro.hostname(hostname, limit=0)
+    assert list(it) == []
+    assert list(pro.hostname(hostname, limit=0).iter_pages()) == []
+
+    # and it should be kept across resumption
+    resumed = HostnameIterator.from_state_token(pro, it.state_token())
+    assert list(resumed) == []
+    assert len(httpserver.log) == 0
+
+
 def test_hostname_empty_results(pro: Pro, httpserver: HTTPServer):
     hostname = "example.com"
 
@@ -73,3 +140,107 @@ def test_hostname_empty_results(pro: Pro, httpserver: HTTPServer):
     got = list(pro.hostname(hostname))
     assert len(got) == 0
     assert len(httpserver.log) == 1
+
+
+def test_hostname_with_state_token(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "2"},
+    ).respond_with_json(
+        {"results": [{"sub_id": "dummy1"}, {"sub_id": "dummy2"}], "pageState": "state1"}
+    )
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "2", "pageState": "state1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy3"}], "pageState": None})
+
+    it = pro.hostname(hostname, size=2, limit=2)
+    assert next(it)["sub_id"] == "dummy1"
+
+    # it should resume right after the last returned result
+    resumed = HostnameIterator.from_state_token(pro, it.state_token())
+    got = list(resumed)
+    assert [r["sub_id"] for r in got] == ["dummy2"]
+
+    # the limit should be kept across resumption
+    resumed = HostnameIterator.from_state_token(pro, resumed.state_token())
+    assert list(resumed) == []
+
+
+def test_hostname_with_state_token_not_consumed(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "2"},
+    ).respond_with_json(
+        {"results": [{"sub_id": "dummy1"}, {"sub_id": "dummy2"}], "pageState": None}
+    )
+
+    it = pro.hostname(hostname, size=2)
+    assert next(it)["sub_id"] == "dummy1"
+
+    # a token of a resumed iteration should keep the offset even if nothing is consumed
+    resumed = HostnameIterator.from_state_token(pro, it.state_token())
+    resumed = HostnameIterator.from_state_token(pro, resumed.state_token())
+    assert [r["sub_id"] for r in resumed] == ["dummy2"]
+
+
+def test_hostname_with_state_token_at_page_boundary(pro: Pro, httpserver: HTTPServer):
+    hostname = "example.com"
+
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy1"}], "pageState": "state1"})
+    httpserver.expect_request(
+        f"/api/v1/hostname/{hostname}",
+        method="GET",
+        query_string={"limit": "1", "pageState": "state1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy2"}], "pageState": None})
+
+    it = pro.hostname(hostname, size=1)
+    assert next(it)["sub_id"] == "dummy1"
+
+    # it should resume from the next page
+    resumed = HostnameIterator.from_state_token(pro, it.state_token())
+    assert [r["sub_id"] for r in resumed] == ["dummy2"]
+
+    # an exhausted iterator should stay exhausted
+    resumed = HostnameIterator.from_state_token(pro, resumed.state_token())
+    assert list(resumed) == []
+
+
+def test_bulk_hostname(pro: Pro, httpserver: HTTPServer):
+    httpserver.expect_request(
+        "/api/v1/hostname/example.com",
+        method="GET",
+        query_string={"limit": "1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy1"}], "pageState": "state1"})
+    httpserver.expect_request(
+        "/api/v1/hostname/example.com",
+        method="GET",
+        query_string={"limit": "1", "pageState": "state1"},
+    ).respond_with_json({"results": [{"sub_id": "dummy2"}], "pageState": None})
+    httpserver.expect_request(
+        "/api/v1/hostname/example.org",
+        method="GET",
+        query_string={"limit": "1"},
+    ).respond_with_json({"message": "Not Found", "status": 404}, status=404)
+
+    got = pro.bulk_hostname(["example.com", "example.org", ""], size=1)
+    # only the first pages should be fetched
+    assert len(httpserver.log) == 2
+
+    assert [hostname for hostname, _ in got] == ["example.com", "example.org", ""]
+    it = got[0][1]
+    assert isinstance(it, HostnameIterator)
+    assert [r["sub_id"] for r in it] == ["dummy1", "dummy2"]
+    assert isinstance(got[1][1], APIError)
+    assert isinstance(got[2][1], ValueError)
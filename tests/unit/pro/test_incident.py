@@ -2,6 +2,7 @@ from typing import Any
 
 from pytest_httpserver import HTTPServer
 
+from urlscan.error import APIError
 from urlscan.pro import Pro
 
 
@@ -176,3 +177,19 @@ def test_get_incident_states(pro: Pro, httpserver: HTTPServer):
 
     got = pro.incident.get_states(incident_id=incident_id)
     assert got == data
+
+
+def test_bulk_get_states(pro: Pro, httpserver: HTTPServer):
+    httpserver.expect_request(
+        "/api/v1/user/incidentstates/foo/",
+        method="GET",
+    ).respond_with_json({"incidentstates": []})
+    httpserver.expect_request(
+        "/api/v1/user/incidentstates/bar/",
+        method="GET",
+    ).respond_with_json({"message": "Not Found", "status": 404}, status=404)
+
+    got = pro.incident.bulk_get_states(["foo", "bar"])
+    assert [incident_id for incident_id, _ in got] == ["foo", "bar"]
+    assert got[0][1] == {"incidentstates": []}
+    assert isinstance(got[1][1], APIError)
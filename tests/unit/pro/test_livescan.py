@@ -1,8 +1,11 @@
+from pathlib import Path
 from typing import Any
 
+import pytest
 from pytest_httpserver import HTTPServer
 
 from urlscan.pro import Pro
+from urlscan.types import LiveScanResourceType
 
 
 def test_get_scanners(pro: Pro, httpserver: HTTPServer):
@@ -13,6 +16,24 @@ def test_get_scanners(pro: Pro, httpserver: HTTPServer):
     assert got == data
 
 
+def test_get_scanners_is_cached(pro: Pro, httpserver: HTTPServer, freezer):
+    data: dict[str, Any] = {"scanners": []}
+    httpserver.expect_request("/api/v1/livescan/scanners/").respond_with_json(data)
+
+    assert pro.livescan.get_scanners() == data
+    assert pro.livescan.get_scanners() == data
+    assert len(httpserver.log) == 1
+
+    # expired
+    freezer.tick(301)
+    assert pro.livescan.get_scanners() == data
+    assert len(httpserver.log) == 2
+
+    pro.livescan.clear_cache()
+    assert pro.livescan.get_scanners() == data
+    assert len(httpserver.log) == 3
+
+
 def test_task(pro: Pro, httpserver: HTTPServer):
     data = {"uuid": "dummy-uuid"}
     httpserver.expect_request(
@@ -35,6 +56,47 @@ def test_scan(pro: Pro, httpserver: HTTPServer):
     assert got == data
 
 
+@pytest.mark.parametrize(
+    ("resource_type", "body", "expected"),
+    [
+        ("result", b'{"task": {}}', {"task": {}}),
+        ("dom", b"<html></html>", "<html></html>"),
+        ("screenshot", b"\x89PNG", b"\x89PNG"),
+    ],
+)
+def test_get_resource(
+    pro: Pro,
+    httpserver: HTTPServer,
+    resource_type: LiveScanResourceType,
+    body: bytes,
+    expected: Any,
+):
+    httpserver.expect_request(
+        f"/api/v1/livescan/de01/{resource_type}/dummy-uuid"
+    ).respond_with_data(body)
+
+    got = pro.livescan.get_resource(
+        scanner_id="de01", resource_type=resource_type, resource_id="dummy-uuid"
+    )
+    assert got == expected
+
+
+def test_download_resource(pro: Pro, httpserver: HTTPServer, tmp_path: Path):
+    data = b"\x89PNG"
+    httpserver.expect_request(
+        "/api/v1/livescan/de01/screenshot/dummy-uuid"
+    ).respond_with_data(data)
+
+    dest = tmp_path / "screenshot.png"
+    pro.livescan.download_resource(
+        scanner_id="de01",
+        resource_type="screenshot",
+        resource_id="dummy-uuid",
+        file=dest,
+    )
+    assert dest.read_bytes() == data
+
+
 def test_purge(pro: Pro, httpserver: HTTPServer):
     data = {"status": "purged"}
     httpserver.expect_request(
@@ -1,3 +1,5 @@
+import httpcore
+import pytest
 from pytest_httpserver import HTTPServer
 
 from urlscan.pro import Pro
@@ -55,3 +57,48 @@ def test_lookup_malicious_observable(pro: Pro, httpserver: HTTPServer):
 
     got = pro.lookup_malicious_observable(type_, value)  # type: ignore[arg-type]
     assert got == data
+
+
+def test_sub_clients_share_connection_pool(pro: Pro, httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/pro/username").respond_with_json({})
+
+    transport = pro._session._transport
+    assert pro.brand._session._transport._transport is transport  # type: ignore
+    assert pro.channel._session._transport._transport is transport  # type: ignore
+
+    # closing a sub-client should not affect the others
+    pro.brand._close()
+    assert pro.get_user() == {}
+
+
+def test_sub_clients_share_proxy(api_key: str):
+    with Pro(api_key=api_key, proxy="http://localhost:8080") as pro:
+        # sub-clients should send requests through the proxy transport of this client
+        transport = pro._session_transport
+        assert isinstance(transport._pool, httpcore.HTTPProxy)  # type: ignore
+        assert pro.brand._session_transport._transport is transport  # type: ignore
+
+
+def test_sub_clients_with_trust_env(api_key: str):
+    with Pro(api_key=api_key, trust_env=True) as pro:
+        # httpx.Client builds the transport (to take proxies from the environment) of both
+        assert pro._session_transport is None
+        assert pro.brand._session_transport is None
+
+
+def test_lazy_imports():
+    from urlscan.pro import Brand, HostnameIterator
+    from urlscan.pro.brand import Brand as Brand_
+    from urlscan.pro.hostname import HostnameIterator as HostnameIterator_
+
+    assert Brand is Brand_
+    assert HostnameIterator is HostnameIterator_
+
+    with pytest.raises(ImportError):
+        from urlscan.pro import Foo  # noqa: F401
+
+
+def test_sub_clients_inherit_configuration(api_key: str):
+    with Pro(api_key, follow_redirects=False, timeout=5) as pro:
+        assert pro.brand._session.follow_redirects is False
+        assert pro.brand._session.timeout == pro._session.timeout
@@ -0,0 +1,212 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Response
+
+from urlscan import AsyncClient
+from urlscan.error import APIError
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_result(httpserver: HTTPServer, api_key: str):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return await asyncio.gather(
+                client.get_result("foo"), client.get_result("bar")
+            )
+
+    httpserver.expect_request("/api/v1/result/foo/").respond_with_json(
+        {"task": {"uuid": "foo"}}
+    )
+    httpserver.expect_request("/api/v1/result/bar/").respond_with_json(
+        {"task": {"uuid": "bar"}}
+    )
+
+    got = run(inner())
+    assert [r["task"]["uuid"] for r in got] == ["foo", "bar"]
+
+    # confirm whether the API key is set or not
+    last_request, _ = httpserver.log[-1]
+    assert last_request.headers["API-Key"] == api_key
+
+
+def test_get_json_with_error(httpserver: HTTPServer, api_key: str):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return await client.get_json("/dummy")
+
+    httpserver.expect_request("/dummy").respond_with_json(
+        {"message": "Not Found", "status": 404}, status=404
+    )
+
+    with pytest.raises(APIError):
+        run(inner())
+
+
+def test_download(httpserver: HTTPServer, api_key: str):
+    async def inner(file):
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            await client.download("/dummy", file)
+
+    data = b"foo"
+    httpserver.expect_request("/dummy").respond_with_data(data)
+
+    with tempfile.NamedTemporaryFile() as tmp_file:
+        run(inner(tmp_file))
+        tmp_file.seek(0)
+        assert tmp_file.read() == data
+
+
+def test_download_to_path(httpserver: HTTPServer, api_key: str, tmp_path: Path):
+    async def inner(path: Path):
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            await client.download("/dummy", path)
+
+    data = b"foo"
+    httpserver.expect_request("/dummy").respond_with_data(data)
+
+    path = tmp_path / "dummy"
+    run(inner(path))
+    assert path.read_bytes() == data
+
+
+def test_download_to_path_with_error(
+    httpserver: HTTPServer, api_key: str, tmp_path: Path
+):
+    async def inner(path: Path):
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            await client.download("/dummy", path)
+
+    httpserver.expect_request("/dummy").respond_with_json(
+        {"message": "Not Found", "status": 404}, status=404
+    )
+
+    path = tmp_path / "dummy"
+    with pytest.raises(APIError):
+        run(inner(path))
+
+    # it should not leave an empty file
+    assert not path.exists()
+
+
+def test_download_with_redirect(httpserver: HTTPServer, api_key: str, tmp_path: Path):
+    async def inner(path: Path):
+        async with AsyncClient(
+            api_key=api_key,
+            base_url=f"http://{httpserver.host}:{httpserver.port}",
+            follow_redirects=False,
+        ) as client:
+            await client.download("/dummy", path)
+
+    httpserver.expect_request("/dummy").respond_with_data(
+        "Found", status=302, headers={"Location": "/elsewhere"}
+    )
+
+    path = tmp_path / "dummy"
+    with pytest.raises(APIError) as exc_info:
+        run(inner(path))
+
+    assert exc_info.value.status == 302
+    # it should not write the redirect response as the file
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_search(httpserver: HTTPServer, api_key: str, prefetch: bool):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return [r async for r in client.search("foo", size=1, prefetch=prefetch)]
+
+    httpserver.expect_ordered_request(
+        "/api/v1/search/", query_string={"q": "foo", "size": "1"}
+    ).respond_with_json({"results": [{"_id": "1", "sort": [1]}], "total": 2})
+    httpserver.expect_ordered_request(
+        "/api/v1/search/",
+        query_string={"q": "foo", "size": "1", "search_after": "1"},
+    ).respond_with_json({"results": [{"_id": "2", "sort": [2]}], "total": 2})
+
+    got = run(inner())
+    assert [r["_id"] for r in got] == ["1", "2"]
+
+
+def test_search_iter_pages(httpserver: HTTPServer, api_key: str):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return [page async for page in client.search("foo", size=1).iter_pages()]
+
+    httpserver.expect_ordered_request(
+        "/api/v1/search/", query_string={"q": "foo", "size": "1"}
+    ).respond_with_json({"results": [{"_id": "1", "sort": [1]}], "total": 2})
+    httpserver.expect_ordered_request(
+        "/api/v1/search/",
+        query_string={"q": "foo", "size": "1", "search_after": "1"},
+    ).respond_with_json({"results": [{"_id": "2", "sort": [2]}], "total": 2})
+
+    got = run(inner())
+    assert [[r["_id"] for r in page] for page in got] == [["1"], ["2"]]
+
+
+@pytest.mark.timeout(10)
+def test_scan_and_get_result(httpserver: HTTPServer, api_key: str):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return await client.scan_and_get_result(
+                "http://example.com", visibility="public", initial_wait=0.0
+            )
+
+    httpserver.expect_request(
+        "/api/v1/scan/",
+        method="POST",
+    ).respond_with_json({"uuid": "dummy"})
+    httpserver.expect_request(
+        "/api/v1/result/dummy/",
+        method="HEAD",
+    ).respond_with_response(Response("", status=200))
+    httpserver.expect_request(
+        "/api/v1/result/dummy/",
+        method="GET",
+    ).respond_with_json({"task": {"uuid": "dummy"}})
+
+    got = run(inner())
+    assert got["task"]["uuid"] == "dummy"
+
+
+def test_scan_with_enforced_visibility(
+    httpserver: HTTPServer, api_key: str, caplog: pytest.LogCaptureFixture
+):
+    async def inner():
+        async with AsyncClient(
+            api_key=api_key, base_url=f"http://{httpserver.host}:{httpserver.port}"
+        ) as client:
+            return await client.scan("http://example.com", visibility="public")
+
+    httpserver.expect_request(
+        "/api/v1/scan/",
+        method="POST",
+    ).respond_with_json({"uuid": "dummy", "visibility": "unlisted"})
+
+    run(inner())
+    # it should warn as the sync client does
+    assert "Visibility is enforced to unlisted." in caplog.text
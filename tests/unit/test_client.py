@@ -1,13 +1,23 @@
 import datetime
 import json
 import tempfile
+from pathlib import Path
 
+import httpcore
+import httpx
 import pytest
 from freezegun.api import FrozenDateTimeFactory
 from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
 
 from urlscan import Client
+from urlscan.client import (
+    BASE_URL,
+    SCAN_UUID_MEMO_TTL,
+    RetryTransport,
+    _shared_transports,
+    close_shared_transports,
+)
 from urlscan.error import APIError, RateLimitError, RateLimitRemainingError
 
 
@@ -45,6 +55,208 @@ def test_download(client: Client, httpserver: HTTPServer):
         assert tmp_file.read() == data
 
 
+def test_download_screenshot(client: Client, httpserver: HTTPServer):
+    data = b"\x89PNG"
+    httpserver.expect_request("/screenshots/dummy.png").respond_with_data(data)
+
+    with tempfile.NamedTemporaryFile() as tmp_file:
+        client.download_screenshot("dummy", file=tmp_file)  # type: ignore
+        tmp_file.seek(0)
+        assert tmp_file.read() == data
+
+
+def test_download_with_error(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request("/dummy").respond_with_json(
+        {"message": "Not Found", "status": 404}, status=404
+    )
+
+    with tempfile.NamedTemporaryFile() as tmp_file:
+        with pytest.raises(APIError) as exc_info:
+            client.download("/dummy", tmp_file)  # type: ignore
+
+        assert exc_info.value.status == 404
+        assert tmp_file.read() == b""
+
+
+def test_download_with_redirect(httpserver: HTTPServer, api_key: str):
+    httpserver.expect_request("/dummy").respond_with_data(
+        "Found", status=302, headers={"Location": "/elsewhere"}
+    )
+    base_url = f"http://{httpserver.host}:{httpserver.port}"
+
+    with (
+        Client(api_key, base_url=base_url, follow_redirects=False) as client,
+        tempfile.TemporaryDirectory() as tmp_dir,
+    ):
+        path = Path(tmp_dir) / "dummy"
+        with pytest.raises(APIError) as exc_info:
+            client.download("/dummy", path)
+
+        assert exc_info.value.status == 302
+        # it should not write the redirect response as the file
+        assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    "body,content_type",
+    [
+        ("<html>Bad Gateway</html>", "text/html"),
+        ('{"error": "Bad Gateway"}', "application/json"),
+    ],
+)
+def test_get_json_with_non_api_error(
+    client: Client, httpserver: HTTPServer, body: str, content_type: str
+):
+    httpserver.expect_request("/dummy").respond_with_data(
+        body, status=502, content_type=content_type
+    )
+
+    with pytest.raises(APIError) as exc_info:
+        client.get_json("/dummy")
+
+    assert exc_info.value.status == 502
+    assert str(exc_info.value) == body
+
+
+def test_download_to_path(client: Client, httpserver: HTTPServer, tmp_path: Path):
+    data = b"foo"
+    httpserver.expect_request("/dummy").respond_with_data(data)
+
+    path = tmp_path / "dummy"
+    client.download("/dummy", path)
+    assert path.read_bytes() == data
+
+
+def test_download_screenshot_to_path(
+    client: Client, httpserver: HTTPServer, tmp_path: Path
+):
+    data = b"\x89PNG"
+    httpserver.expect_request("/screenshots/dummy.png").respond_with_data(data)
+
+    path = tmp_path / "dummy.png"
+    client.download_screenshot("dummy", file=path)
+    assert path.read_bytes() == data
+
+
+def test_download_to_path_with_error(
+    client: Client, httpserver: HTTPServer, tmp_path: Path
+):
+    httpserver.expect_request("/dummy").respond_with_json(
+        {"message": "Not Found", "status": 404}, status=404
+    )
+
+    path = tmp_path / "dummy"
+    with pytest.raises(APIError):
+        client.download("/dummy", path)
+
+    # it should not leave an empty file
+    assert not path.exists()
+
+
+def test_from_shared(httpserver: HTTPServer):
+    httpserver.expect_request("/dummy").respond_with_json({})
+    base_url = f"http://{httpserver.host}:{httpserver.port}"
+
+    foo = Client.from_shared("foo", base_url=base_url)
+    bar = Client.from_shared("bar", base_url=base_url)
+    # both clients should use the same underlying transport
+    assert foo._transport._transport is bar._transport._transport  # type: ignore
+
+    # closing a client should not close the shared transport
+    foo._close()
+    bar._get("/dummy")
+
+    # API key should be set per client
+    last_request, _ = httpserver.log[-1]
+    assert last_request.headers["API-Key"] == "bar"
+    bar._close()
+
+
+def test_from_shared_in_separate_scopes(httpserver: HTTPServer):
+    httpserver.expect_request("/dummy").respond_with_json({})
+    base_url = f"http://{httpserver.host}:{httpserver.port}"
+
+    def get_transport(api_key: str) -> httpx.BaseTransport:
+        with Client.from_shared(api_key, base_url=base_url) as client:
+            client._get("/dummy")
+            return client._transport._transport  # type: ignore
+
+    # a short-lived client should reuse the pool of a closed (and unreferenced) one
+    foo = get_transport("foo")
+    assert len(_shared_transports) > 0
+    bar = get_transport("bar")
+    assert foo is bar
+
+    # the pool should be closed & not reused after close_shared_transports
+    close_shared_transports()
+    assert len(_shared_transports) == 0
+    assert get_transport("baz") is not foo
+
+
+def test_from_shared_with_trust_env():
+    foo = Client.from_shared("foo", trust_env=True)
+    bar = Client.from_shared("bar", trust_env=False)
+    # clients with different trust_env settings should not share a pool
+    assert foo._transport._transport is not bar._transport._transport  # type: ignore
+    foo._close()
+    bar._close()
+
+
+def test_from_shared_with_proxy():
+    foo = Client.from_shared("foo", proxy="http://localhost:8080")
+    bar = Client.from_shared("bar", proxy="http://localhost:8080")
+    # requests of both clients should go through the same shared proxy transport
+    url = httpx.URL(BASE_URL)
+    foo_transport = foo._session._transport_for_url(url)
+    bar_transport = bar._session._transport_for_url(url)
+    assert foo_transport._transport is bar_transport._transport  # type: ignore
+    assert isinstance(foo_transport._transport._pool, httpcore.HTTPProxy)  # type: ignore
+    foo._close()
+    bar._close()
+
+
+def test_from_shared_with_transport():
+    with pytest.raises(TypeError):
+        Client.from_shared("foo", transport=httpx.HTTPTransport())
+
+
+def test_closed_client(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request("/dummy").respond_with_json({})
+
+    client._close()
+    # closing should be idempotent
+    client._close()
+
+    with pytest.raises(RuntimeError):
+        client.get_json("/dummy")
+
+    assert len(httpserver.log) == 0
+
+
+def test_limits(httpserver: HTTPServer, api_key: str):
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    with Client(
+        api_key=api_key,
+        base_url=f"http://{httpserver.host}:{httpserver.port}",
+        limits=limits,
+    ) as client:
+        pool = client._session._transport._pool  # type: ignore
+        assert pool._max_connections == 1
+        assert pool._max_keepalive_connections == 1
+
+
+def test_http2(httpserver: HTTPServer, api_key: str):
+    pytest.importorskip("h2")
+
+    with Client(
+        api_key=api_key,
+        base_url=f"http://{httpserver.host}:{httpserver.port}",
+        http2=True,
+    ) as client:
+        pool = client._session._transport._pool  # type: ignore
+        assert pool._http2 is True
+
+
 def test_search(client: Client, httpserver: HTTPServer):
     q = "foo"
 
@@ -91,6 +303,99 @@ def test_search_with_iteration_within_10000_results(
     assert len(httpserver.log) == 2
 
 
+def test_search_after(client: Client, httpserver: HTTPServer):
+    q = "foo"
+
+    httpserver.expect_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "100"},
+    ).respond_with_json(
+        {
+            "results": [{"sort": [1, "dummy"]}, {"sort": [2, "dummy"]}],
+            "has_more": False,
+            "total": 2,
+        }
+    )
+
+    it = client.search(q)
+    assert it.search_after is None
+
+    next(it)
+    # it should point to the last returned result (not the last result of the page)
+    assert it.search_after == "1,dummy"
+
+
+def test_search_iter_pages(client: Client, httpserver: HTTPServer):
+    q = "foo"
+
+    httpserver.expect_ordered_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "2"},
+    ).respond_with_json(
+        {"results": [{"sort": [1, "dummy"]}, {"sort": [2, "dummy"]}], "total": 3}
+    )
+    httpserver.expect_ordered_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "2", "search_after": "2,dummy"},
+    ).respond_with_json({"results": [{"sort": [3, "dummy"]}], "total": 3})
+
+    it = client.search(q, size=2)
+    got = list(it.iter_pages())
+    assert [len(page) for page in got] == [2, 1]
+    assert it.search_after == "3,dummy"
+    assert len(httpserver.log) == 2
+
+
+def test_search_iter_pages_with_limit(client: Client, httpserver: HTTPServer):
+    q = "foo"
+
+    httpserver.expect_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "2"},
+    ).respond_with_json(
+        {"results": [{"sort": [1, "dummy"]}, {"sort": [2, "dummy"]}], "total": 3}
+    )
+
+    got = list(client.search(q, size=2, limit=1).iter_pages())
+    # the page should be truncated by the limit
+    assert got == [[{"sort": [1, "dummy"]}]]
+    assert len(httpserver.log) == 1
+
+
+def test_search_with_zero_limit(client: Client, httpserver: HTTPServer):
+    # limit=0 should return nothing without sending a request
+    assert list(client.search("foo", limit=0)) == []
+    assert list(client.search("foo", limit=0).iter_pages()) == []
+    assert len(httpserver.log) == 0
+
+
+def test_search_with_prefetch(client: Client, httpserver: HTTPServer):
+    q = "foo"
+
+    httpserver.expect_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "1"},
+    ).respond_with_json(
+        {"results": [{"sort": [1, "dummy"]}], "has_more": False, "total": 2}
+    )
+    httpserver.expect_request(
+        "/api/v1/search/",
+        method="GET",
+        query_string={"q": q, "size": "1", "search_after": "1,dummy"},
+    ).respond_with_json(
+        {"results": [{"sort": [2, "dummy"]}], "has_more": False, "total": 2}
+    )
+
+    got = list(client.search(q, size=1, prefetch=True))
+    assert [r["sort"][0] for r in got] == [1, 2]
+    assert len(httpserver.log) == 2
+
+
 def test_search_with_iteration_over_10000_results(
     client: Client, httpserver: HTTPServer
 ):
@@ -140,7 +445,37 @@ def test_search_with_iteration_over_10000_results(
     assert len(httpserver.log) == 2
 
 
-def test_retry(client: Client, httpserver: HTTPServer):
+@pytest.mark.parametrize(
+    "method, path, json_data, extensions, expected",
+    [
+        ("GET", "/api/v1/search/", None, {}, "search"),
+        ("GET", "/api/v1/result/dummy/", None, {}, "retrieve"),
+        ("GET", "/dummy", None, {}, None),
+        ("POST", "/api/v1/scan/", {"visibility": "private"}, {}, "private"),
+        (
+            "POST",
+            "/api/v1/scan/",
+            {"visibility": "private"},
+            {"urlscan_action": "unlisted"},
+            "unlisted",
+        ),
+    ],
+)
+def test_get_action(
+    client: Client,
+    method: str,
+    path: str,
+    json_data: dict | None,
+    extensions: dict,
+    expected: str | None,
+):
+    req = client._session.build_request(
+        method, path, json=json_data, extensions=extensions
+    )
+    assert client._get_action(req) == expected
+
+
+def test_retry(httpserver: HTTPServer, api_key: str):
     def handler(_: Request):
         # return 429 if it's the first request
         if len(httpserver.log) == 0:
@@ -154,14 +489,72 @@ def test_retry(client: Client, httpserver: HTTPServer):
         method="GET",
     ).respond_with_handler(handler)
 
-    client._retry = True
+    with Client(
+        api_key=api_key,
+        base_url=f"http://{httpserver.host}:{httpserver.port}",
+        retry=True,
+    ) as client:
+        got = client._get("/dummy")
 
-    got = client._get("/dummy")
     assert got._res.status_code == 200
     # it should have two requests & responses
     assert len(httpserver.log) == 2
 
 
+def test_retry_transport_delay():
+    transport = RetryTransport(jitter=0.5, base_delay=0.1, max_delay=1.0)
+    for _ in range(10):
+        # use X-Rate-Limit-Reset-After with jitter
+        delay = transport._get_delay(1.0, 0)
+        assert 1.0 <= delay <= 1.5
+
+        # the server hint should be used as it is even after many retries
+        delay = transport._get_delay(0.1, 10)
+        assert 0.1 <= delay <= 0.6
+
+        # fallback to exponential backoff
+        delay = transport._get_delay(None, 2)
+        assert 0.2 <= delay <= 0.4
+
+        # exponential backoff should be capped
+        delay = transport._get_delay(None, 10)
+        assert 0.5 <= delay <= 1.0
+
+
+def test_retry_transport_with_connect_retries():
+    transport = RetryTransport(connect_retries=5)
+    assert transport._pool._retries == 5
+
+    # retries of httpx.HTTPTransport should be accepted as well
+    transport = RetryTransport(retries=1)
+    assert transport._pool._retries == 1
+
+
+def test_retry_with_proxy(api_key: str):
+    with Client(api_key=api_key, retry=True, proxy="http://localhost:8080") as client:
+        # requests should be sent with the retry transport (routing the proxy by itself)
+        transport = client._session._transport_for_url(httpx.URL(BASE_URL))
+        assert isinstance(transport, RetryTransport)
+        assert isinstance(transport._pool, httpcore.HTTPProxy)
+
+
+def test_retry_with_max_retries(httpserver: HTTPServer):
+    httpserver.expect_request(
+        "/dummy",
+        method="GET",
+    ).respond_with_response(
+        Response("", status=429, headers={"X-Rate-Limit-Reset-After": "0"})
+    )
+
+    transport = RetryTransport(jitter=0, max_retries=2)
+    with httpx.Client(transport=transport) as session:
+        got = session.get(httpserver.url_for("/dummy"))
+
+    # it should give up after the initial request + 2 retries
+    assert got.status_code == 429
+    assert len(httpserver.log) == 3
+
+
 def test_without_retry(client: Client, httpserver: HTTPServer):
     httpserver.expect_request(
         "/dummy",
@@ -174,6 +567,20 @@ def test_without_retry(client: Client, httpserver: HTTPServer):
         client.get_json("/dummy")
 
 
+def test_rate_limit_with_unknown_action(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request("/dummy").respond_with_json(
+        {},
+        headers={
+            "X-Rate-Limit-Action": "unknown",
+            "X-Rate-Limit-Remaining": "0",
+            "X-Rate-Limit-Reset": "2020-01-02T00:00:00.000Z",
+        },
+    )
+
+    client.get_json("/dummy")
+    assert "unknown" not in client._rate_limit_memo
+
+
 @pytest.mark.freeze_time("2020-01-01")
 def test_rate_limit_remaining_error(
     client: Client, httpserver: HTTPServer, freezer: FrozenDateTimeFactory
@@ -225,6 +632,71 @@ def test_rate_limit_remaining_error(
         client.get_result("dummy")
 
 
+def test_bulk_get_result(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request("/api/v1/result/foo/").respond_with_json(
+        {"task": {"uuid": "foo"}}
+    )
+    httpserver.expect_request("/api/v1/result/bar/").respond_with_json(
+        {"message": "Not Found", "status": 404}, status=404
+    )
+
+    got = client.bulk_get_result(["foo", "bar"])
+    assert [uuid for uuid, _ in got] == ["foo", "bar"]
+    assert got[0][1] == {"task": {"uuid": "foo"}}
+    assert isinstance(got[1][1], APIError)
+
+
+def test_get_result_with_cache(httpserver: HTTPServer, api_key: str):
+    httpserver.expect_request(
+        "/api/v1/result/dummy/",
+        method="GET",
+    ).respond_with_json({"task": {"uuid": "dummy"}})
+
+    with Client(
+        api_key=api_key,
+        base_url=f"http://{httpserver.host}:{httpserver.port}",
+        result_cache_size=1,
+    ) as client:
+        assert client.get_result("dummy") == client.get_result("dummy")
+        # second call should be served from the cache
+        assert len(httpserver.log) == 1
+
+        client.clear_result_cache()
+        client.get_result("dummy")
+        assert len(httpserver.log) == 2
+
+
+def test_get_json_with_etag_cache(httpserver: HTTPServer, api_key: str):
+    def handler(request: Request) -> Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(status=304)
+
+        return Response(
+            json.dumps({"foo": "bar"}),
+            headers={"ETag": '"v1"'},
+            content_type="application/json",
+        )
+
+    httpserver.expect_request("/dummy").respond_with_handler(handler)
+
+    with Client(
+        api_key=api_key,
+        base_url=f"http://{httpserver.host}:{httpserver.port}",
+        etag_cache_size=1,
+    ) as client:
+        assert client.get_json("/dummy") == {"foo": "bar"}
+        # second call should be revalidated and served from the cache
+        assert client.get_json("/dummy") == {"foo": "bar"}
+        assert len(httpserver.log) == 2
+        assert "If-None-Match" not in httpserver.log[0][0].headers
+        assert httpserver.log[1][0].headers["If-None-Match"] == '"v1"'
+        assert httpserver.log[1][1].status_code == 304
+
+        client.clear_cache()
+        client.get_json("/dummy")
+        assert "If-None-Match" not in httpserver.log[2][0].headers
+
+
 def test_scan(client: Client, httpserver: HTTPServer):
     httpserver.expect_request(
         "/api/v1/scan/",
@@ -242,6 +714,27 @@ def test_scan(client: Client, httpserver: HTTPServer):
     assert got["uuid"] == "dummy"
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_scan_request_body(
+    client: Client,
+    httpserver: HTTPServer,
+    monkeypatch: pytest.MonkeyPatch,
+    use_orjson: bool,
+):
+    if not use_orjson:
+        monkeypatch.setattr("urlscan.client.orjson", None)
+
+    httpserver.expect_request(
+        "/api/v1/scan/",
+        method="POST",
+        headers={"Content-Type": "application/json"},
+        json={"url": "http://example.com", "visibility": "public"},
+    ).respond_with_json({"uuid": "dummy"})
+
+    got = client.scan("http://example.com", visibility="public")
+    assert got["uuid"] == "dummy"
+
+
 def test_bulk_scan(client: Client, httpserver: HTTPServer):
     httpserver.expect_request(
         "/api/v1/scan/",
@@ -267,6 +760,23 @@ def test_bulk_scan(client: Client, httpserver: HTTPServer):
         assert r["uuid"] == "dummy"
 
 
+def test_memoize_scan_uuid(
+    client: Client, monkeypatch: pytest.MonkeyPatch, freezer: FrozenDateTimeFactory
+):
+    monkeypatch.setattr("urlscan.client.SCAN_UUID_MEMO_MAXSIZE", 2)
+
+    client._memoize_scan_uuid("foo")
+    client._memoize_scan_uuid("bar")
+    client._memoize_scan_uuid("baz")
+    # the oldest one should be evicted
+    assert list(client._scan_uuid_timestamp_memo) == ["bar", "baz"]
+
+    # expired ones should be evicted as well
+    freezer.tick(SCAN_UUID_MEMO_TTL + 1)
+    client._memoize_scan_uuid("qux")
+    assert list(client._scan_uuid_timestamp_memo) == ["qux"]
+
+
 @pytest.mark.timeout(10)
 def test_wait_for_result(client: Client, httpserver: HTTPServer):
     httpserver.expect_request(
@@ -276,6 +786,20 @@ def test_wait_for_result(client: Client, httpserver: HTTPServer):
     assert client.wait_for_result("dummy", initial_wait=0.0) is None  # type: ignore
 
 
+@pytest.mark.timeout(10)
+def test_wait_for_results(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request(
+        "/api/v1/result/foo/",
+        method="HEAD",
+    ).respond_with_response(Response("", status=200))
+    httpserver.expect_request(
+        "/api/v1/result/bar/",
+        method="HEAD",
+    ).respond_with_response(Response("", status=200))
+    assert client.wait_for_results(["foo", "bar"], initial_wait=0.0) is None  # type: ignore
+    assert len(httpserver.log) == 2
+
+
 @pytest.mark.timeout(10)
 def test_scan_and_get_result(client: Client, httpserver: HTTPServer):
     httpserver.expect_request(
@@ -343,6 +867,61 @@ def test_bulk_scan_and_get_results(client: Client, httpserver: HTTPServer):
         assert r["task"]["uuid"] == "dummy"
 
 
+@pytest.mark.timeout(10)
+def test_bulk_scan_and_get_results_with_timeout(client: Client, httpserver: HTTPServer):
+    httpserver.expect_request(
+        "/api/v1/scan/",
+        method="POST",
+    ).respond_with_json(
+        {
+            "uuid": "dummy",
+        }
+    )
+    httpserver.expect_request(
+        "/api/v1/result/dummy/",
+        method="HEAD",
+    ).respond_with_response(Response("", status=404))
+
+    got = client.bulk_scan_and_get_results(
+        ["http://example.com"],
+        visibility="public",
+        initial_wait=0.0,
+        timeout=0.0,
+    )
+    assert len(got) == 1
+    _, r = got[0]
+    assert isinstance(r, TimeoutError)
+
+
+@pytest.mark.timeout(10)
+def test_bulk_scan_and_get_results_with_polling_error(api_key: str):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            url: str = json.loads(request.content)["url"]
+            return httpx.Response(200, json={"uuid": url.removeprefix("http://")})
+
+        if request.url.path == "/api/v1/result/example.org/":
+            raise httpx.ConnectError("connection refused", request=request)
+
+        if request.method == "HEAD":
+            return httpx.Response(200)
+
+        return httpx.Response(200, json={"task": {"uuid": "example.com"}})
+
+    with Client(api_key=api_key, transport=httpx.MockTransport(handler)) as client:
+        got = client.bulk_scan_and_get_results(
+            ["http://example.com", "http://example.org"],
+            visibility="public",
+            initial_wait=0.0,
+        )
+
+    # a failure of polling one result should not discard the others
+    assert got[0] == ("http://example.com", {"task": {"uuid": "example.com"}})
+    url, error = got[1]
+    assert url == "http://example.org"
+    assert isinstance(error, httpx.ConnectError)
+
+
 def test_get_available_countries(client: Client, httpserver: HTTPServer):
     data = {
         "countries": [
@@ -4,7 +4,15 @@ from pathlib import Path
 
 import pytest
 
-from urlscan.utils import _merge, _parse_datetime, extract
+from urlscan.utils import (
+    _backoff,
+    _cached_property,
+    _LRUCache,
+    _merge,
+    _parse_datetime,
+    _parse_retry_after,
+    extract,
+)
 
 
 def test_merge():
@@ -22,6 +30,52 @@ def test_merge_with_duplication():
         inner(b=3)
 
 
+@pytest.mark.parametrize(
+    "attempts, expected_max",
+    [
+        (0, 1.0),
+        (1, 2.0),
+        (2, 4.0),
+        (10, 8.0),
+        (1024, 8.0),
+    ],
+)
+def test_backoff(attempts: int, expected_max: float):
+    for _ in range(10):
+        delay = _backoff(1.0, 8.0, attempts)
+        assert expected_max / 2 <= delay <= expected_max
+
+
+def test_backoff_with_fixed_interval():
+    # it should not overflow with a large number of attempts
+    delay = _backoff(0.01, 0.01, 1024)
+    assert 0.005 <= delay <= 0.01
+
+
+def test_lru_cache():
+    cache = _LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # "a" becomes the most recently used
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    # "b" is evicted as the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_with_zero_maxsize():
+    cache = _LRUCache(0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
 @pytest.mark.parametrize(
     "input_str, expected",
     [
@@ -36,6 +90,45 @@ def test_parse_datetime(input_str: str, expected: datetime.datetime):
     assert result == expected
 
 
+def test_cached_property():
+    class Foo:
+        def __init__(self):
+            self.calls = 0
+
+        @_cached_property
+        def bar(self) -> int:
+            self.calls += 1
+            return self.calls
+
+    foo = Foo()
+    assert foo.bar == 1
+    assert foo.bar == 1
+    assert foo.calls == 1
+    # it should be cached per instance
+    assert Foo().bar == 1
+    assert isinstance(Foo.bar, _cached_property)
+
+
+@pytest.mark.freeze_time("2020-01-01T00:00:00Z")
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.5", 1.5),
+        ("120", 120.0),
+        ("-1", 0.0),
+        ("Wed, 01 Jan 2020 00:00:30 GMT", 30.0),
+        # a past date should not result in a negative delay
+        ("Tue, 31 Dec 2019 23:59:00 GMT", 0.0),
+        (None, None),
+        ("", None),
+        ("nan", None),
+        ("foo", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None):
+    assert _parse_retry_after(value) == expected
+
+
 @pytest.fixture
 def gz():
     return "tests/unit/fixtures/test.gz"